@@ -0,0 +1,12 @@
+class EagerLoadingMixin:
+    """
+    Applies the serializer class's setup_eager_loading() to the view queryset,
+    so the relations loaded always follow the serializer the view renders with.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        setup_eager_loading = getattr(self.get_serializer_class(), 'setup_eager_loading', None)
+        if setup_eager_loading is None:
+            return queryset
+        return setup_eager_loading(queryset)
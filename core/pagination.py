@@ -0,0 +1,11 @@
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class StandardResultsSetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination for catalog listings, so a request only serializes
+    (and prefetches relations for) one page of rows.
+    Clients page with ?limit= and ?offset=; limit is capped at max_limit.
+    """
+    default_limit = 25
+    max_limit = 100
@@ -0,0 +1,24 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson doesn't handle natively (Decimal, lazy strings, ...) go through DRF's encoder
+_default_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes the response with orjson instead of the stdlib json module.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # ListField/ListSerializer errors are keyed by item index, e.g. {'ids': {0: [...]}}
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_default_encoder.default, option=option)
@@ -1,3 +1,81 @@
-from django.shortcuts import render
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.utils import timezone
 
-# Create your views here.
+
+def flag_changes(model, field, value):
+    """
+    Returns the .update() kwargs that set field to value, bumping the model's
+    auto_now fields (update_date, last_access) by hand since .update() skips them.
+    """
+    changes = {field: value}
+    for model_field in model._meta.concrete_fields:
+        if getattr(model_field, 'auto_now', False):
+            changes[model_field.name] = timezone.now()
+    return changes
+
+
+def toggle_flag(model, pk, field, value):
+    """
+    Sets field to value on one row with a single conditional UPDATE.
+    Returns False when the row was already in that state and raises Http404
+    when it does not exist; only those cases run a second (exists) query.
+    """
+    if model.objects.filter(pk=pk).exclude(**{field: value}).update(**flag_changes(model, field, value)):
+        return True
+    if not model.objects.filter(pk=pk).exists():
+        raise Http404
+    return False
+
+
+class FlagToggleView(APIView):
+    """
+    Base view that sets a boolean flag on one row with a conditional UPDATE.
+
+    POST: Sets `field` to `value` for the given pk and responds with the
+    serialized object, or 400 when it was already in that state.
+    Requires JWT authentication via Bearer token.
+    """
+    permission_classes = [IsAuthenticated]
+    model = None
+    field = 'active'
+    value = True
+    serializer_class = None
+    response_key = None
+    message = ''
+    already_message = ''
+
+    def after_update(self):
+        """Hook for work that .update() skips, such as signal-driven cache invalidation."""
+
+    def toggle(self, pk):
+        """
+        Sets the flag and returns the object to serialize, or None when it
+        was already in that state.
+        """
+        if not toggle_flag(self.model, pk, self.field, self.value):
+            return None
+
+        self.after_update()
+
+        queryset = self.model.objects.all()
+        setup_eager_loading = getattr(self.serializer_class, 'setup_eager_loading', None)
+        if setup_eager_loading is not None:
+            queryset = setup_eager_loading(queryset)
+        return get_object_or_404(queryset, pk=pk)
+
+    def post(self, request, pk):
+        instance = self.toggle(pk)
+        if instance is None:
+            return Response({
+                'message': self.already_message
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'message': self.message,
+            self.response_key: self.serializer_class(instance).data
+        }, status=status.HTTP_200_OK)
@@ -4,7 +4,31 @@ from products.models import *
 # Register your models here.
 admin.site.register(Brand)
 admin.site.register(Category)
-admin.site.register(BaseProduct)
-admin.site.register(ProductVariant)
-admin.site.register(Image)
-admin.site.register(Discount)
\ No newline at end of file
+
+
+@admin.register(BaseProduct)
+class BaseProductAdmin(admin.ModelAdmin):
+    list_display = ('model_name', 'brand', 'active')
+    list_select_related = ('brand',)
+    raw_id_fields = ('user_last_modified',)
+
+
+@admin.register(ProductVariant)
+class ProductVariantAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'price', 'condition', 'stock_status', 'is_published', 'active')
+    list_select_related = ('base_product', 'base_product__brand')
+    raw_id_fields = ('base_product', 'user_last_modified')
+
+
+@admin.register(Image)
+class ImageAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'base_product', 'active')
+    list_select_related = ('base_product', 'base_product__brand')
+    raw_id_fields = ('base_product',)
+
+
+@admin.register(Discount)
+class DiscountAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'discount_price', 'active')
+    list_select_related = ('product_variant', 'product_variant__base_product')
+    raw_id_fields = ('product_variant',)
@@ -0,0 +1,27 @@
+from django.core.cache import cache
+
+BRAND_LIST_KEY = 'products:brand_list'
+CATEGORY_LIST_KEY = 'products:category_list'
+LIST_CACHE_TIMEOUT = 60
+
+
+def get_cached_list(key, build):
+    """
+    Returns the serialized list stored under key, calling build() to
+    produce (and cache) it on a miss.
+    """
+    data = cache.get(key)
+    if data is None:
+        data = list(build())
+        cache.set(key, data, LIST_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_brand_caches():
+    """Drops the cached brand list."""
+    cache.delete(BRAND_LIST_KEY)
+
+
+def invalidate_category_caches():
+    """Drops the cached category list."""
+    cache.delete(CATEGORY_LIST_KEY)
@@ -1,5 +1,6 @@
+from django.db.models import Exists, OuterRef
 from django_filters import rest_framework as filters
-from .models import BaseProduct, ProductVariant
+from .models import BaseProduct, ProductSpec, ProductVariant
 
 
 class BaseProductFilter(filters.FilterSet):
@@ -14,7 +15,7 @@ class BaseProductFilter(filters.FilterSet):
     - categories: Category ID (can filter by multiple)
     - active: Boolean
 
-    JSON specs filtering (examples):
+    Specs filtering (examples):
     - spec_processor_model: Filter by processor model (e.g., "Intel Core i5")
     - spec_screen_size: Filter by screen size (e.g., "15.6\"")
     - spec_memory_size: Filter by memory size (e.g., "16GB")
@@ -22,8 +23,12 @@ class BaseProductFilter(filters.FilterSet):
     - spec_storage_size: Filter by storage size
     - spec_weight: Filter by weight
 
-    The spec_ prefix allows filtering any nested JSON field using double underscores
-    for nested keys (e.g., spec_processor__model, spec_screen__size)
+    The spec_ filters target columns denormalized from the specs JSON
+    (see BaseProduct.sync_spec_fields), so they can use database indexes.
+
+    Any other spec can be filtered with spec=<key>:<value>, where key is the
+    dotted path inside specs (e.g. spec=connectivity:wifi 6). It uses the
+    indexed ProductSpec rows.
     """
 
     # Basic field filters
@@ -34,86 +39,100 @@ class BaseProductFilter(filters.FilterSet):
     categories = filters.NumberFilter(field_name='categories__id')
     active = filters.BooleanFilter()
 
-    # JSON field filters for common specs
-    # These use JSONField lookups to filter within the specs JSON
+    # Filters for common specs
+    # These use the indexed columns copied from the specs JSON
 
     # Processor filters
     spec_processor_model = filters.CharFilter(
-        field_name='specs__processor__model',
+        field_name='processor_model',
         lookup_expr='icontains',
         label='Processor Model'
     )
     spec_processor_cores = filters.NumberFilter(
-        field_name='specs__processor__cores',
+        field_name='processor_cores',
         lookup_expr='exact',
         label='Processor Cores'
     )
 
     # Screen filters
     spec_screen_size = filters.CharFilter(
-        field_name='specs__screen__size',
+        field_name='screen_size',
         lookup_expr='icontains',
         label='Screen Size'
     )
     spec_screen_resolution = filters.CharFilter(
-        field_name='specs__screen__resolution',
+        field_name='screen_resolution',
         lookup_expr='icontains',
         label='Screen Resolution'
     )
     spec_screen_refresh_rate = filters.CharFilter(
-        field_name='specs__screen__refresh_rate',
+        field_name='screen_refresh_rate',
         lookup_expr='icontains',
         label='Screen Refresh Rate'
     )
 
     # Memory filters
     spec_memory_size = filters.CharFilter(
-        field_name='specs__memory__size',
+        field_name='memory_size',
         lookup_expr='icontains',
         label='Memory Size'
     )
     spec_memory_type = filters.CharFilter(
-        field_name='specs__memory__type',
+        field_name='memory_type',
         lookup_expr='icontains',
         label='Memory Type'
     )
 
     # Graphics filters
     spec_graphics_model = filters.CharFilter(
-        field_name='specs__graphics__model',
+        field_name='graphics_model',
         lookup_expr='icontains',
         label='Graphics Card Model'
     )
     spec_graphics_vram = filters.CharFilter(
-        field_name='specs__graphics__vram',
+        field_name='graphics_vram',
         lookup_expr='icontains',
         label='Graphics VRAM'
     )
 
     # Storage filters
     spec_storage_size = filters.CharFilter(
-        field_name='specs__storage__size',
+        field_name='storage_size',
         lookup_expr='icontains',
         label='Storage Size'
     )
     spec_storage_type = filters.CharFilter(
-        field_name='specs__storage__type',
+        field_name='storage_type',
         lookup_expr='icontains',
         label='Storage Type'
     )
 
     # Physical attributes
     spec_weight = filters.CharFilter(
-        field_name='specs__weight',
+        field_name='weight',
         lookup_expr='icontains',
         label='Weight'
     )
     spec_battery = filters.CharFilter(
-        field_name='specs__battery',
+        field_name='battery',
         lookup_expr='icontains',
         label='Battery'
     )
 
+    # Any spec key, through the ProductSpec rows
+    spec = filters.CharFilter(method='filter_spec', label='Spec (key:value)')
+
+    def filter_spec(self, queryset, name, value):
+        """Filter by a key:value pair found anywhere in specs (value is a partial match)."""
+        key, separator, spec_value = value.partition(':')
+        if not separator:
+            return queryset
+        return queryset.filter(Exists(ProductSpec.objects.filter(
+            base_product=OuterRef('pk'),
+            key=key.strip(),
+            value_text__icontains=spec_value.strip()
+        )))
+
     class Meta:
         model = BaseProduct
         fields = [
@@ -135,7 +154,8 @@ class BaseProductFilter(filters.FilterSet):
             'spec_storage_size',
             'spec_storage_type',
             'spec_weight',
-            'spec_battery'
+            'spec_battery',
+            'spec'
         ]
 
 
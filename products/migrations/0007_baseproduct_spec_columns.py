@@ -0,0 +1,100 @@
+# Generated by Django 5.2.6 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+BACKFILL_SPEC_COLUMNS = """
+UPDATE products_baseproduct SET
+    processor_model = COALESCE(LEFT(specs->'processor'->>'model', 255), ''),
+    processor_cores = CASE
+        WHEN specs->'processor'->>'cores' ~ '^[0-9]{1,4}$' THEN (specs->'processor'->>'cores')::smallint
+        ELSE NULL
+    END,
+    screen_size = COALESCE(LEFT(specs->'screen'->>'size', 50), ''),
+    screen_resolution = COALESCE(LEFT(specs->'screen'->>'resolution', 100), ''),
+    screen_refresh_rate = COALESCE(LEFT(specs->'screen'->>'refresh_rate', 50), ''),
+    memory_size = COALESCE(LEFT(specs->'memory'->>'size', 50), ''),
+    memory_type = COALESCE(LEFT(specs->'memory'->>'type', 50), ''),
+    graphics_model = COALESCE(LEFT(specs->'graphics'->>'model', 255), ''),
+    graphics_vram = COALESCE(LEFT(specs->'graphics'->>'vram', 50), ''),
+    storage_size = COALESCE(LEFT(specs->'storage'->>'size', 50), ''),
+    storage_type = COALESCE(LEFT(specs->'storage'->>'type', 50), ''),
+    weight = COALESCE(LEFT(specs->>'weight', 50), ''),
+    battery = COALESCE(LEFT(specs->>'battery', 50), '');
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_rename_is_publishied_productvariant_is_published'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='baseproduct',
+            name='battery',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Battery, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='graphics_model',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Graphics card model, copied from specs', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='graphics_vram',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Graphics VRAM, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='memory_size',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Memory size, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='memory_type',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Memory type, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='processor_cores',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, editable=False, help_text='Processor cores, copied from specs', null=True),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='processor_model',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Processor model, copied from specs', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='screen_refresh_rate',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Screen refresh rate, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='screen_resolution',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Screen resolution, copied from specs', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='screen_size',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Screen size, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='storage_size',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Storage size, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='storage_type',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Storage type, copied from specs', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='baseproduct',
+            name='weight',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Weight, copied from specs', max_length=50),
+        ),
+        migrations.RunSQL(BACKFILL_SPEC_COLUMNS, migrations.RunSQL.noop),
+    ]
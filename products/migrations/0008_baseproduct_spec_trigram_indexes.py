@@ -0,0 +1,65 @@
+# Generated by Django 5.2.6 on 2026-10-15 09:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0007_baseproduct_spec_columns'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('processor_model'), name='gin_trgm_ops'), name='bp_processor_model_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('screen_size'), name='gin_trgm_ops'), name='bp_screen_size_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('screen_resolution'), name='gin_trgm_ops'), name='bp_screen_resolution_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('screen_refresh_rate'), name='gin_trgm_ops'), name='bp_screen_refresh_rate_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('memory_size'), name='gin_trgm_ops'), name='bp_memory_size_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('memory_type'), name='gin_trgm_ops'), name='bp_memory_type_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('graphics_model'), name='gin_trgm_ops'), name='bp_graphics_model_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('graphics_vram'), name='gin_trgm_ops'), name='bp_graphics_vram_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('storage_size'), name='gin_trgm_ops'), name='bp_storage_size_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('storage_type'), name='gin_trgm_ops'), name='bp_storage_type_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('weight'), name='gin_trgm_ops'), name='bp_weight_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('battery'), name='gin_trgm_ops'), name='bp_battery_trgm'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_baseproduct_spec_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='baseproduct',
+            options={'ordering': ['-update_date'], 'verbose_name': 'Base Product', 'verbose_name_plural': 'Base Products'},
+        ),
+        migrations.AlterField(
+            model_name='baseproduct',
+            name='update_date',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(fields=['price', 'condition'], name='pv_price_condition_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_baseproduct_ordering_productvariant_price_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(condition=models.Q(('active', True), ('is_published', True)), fields=['stock_status', 'price'], name='pv_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(fields=['base_product', 'active'], name='pv_base_product_active_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_productvariant_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='image',
+            name='base_product',
+            field=models.ForeignKey(help_text='Base product to which the image belongs', on_delete=django.db.models.deletion.PROTECT, related_name='images', to='products.baseproduct'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:50
+
+import json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def flatten_specs(specs, prefix=''):
+    if isinstance(specs, dict):
+        for key, value in specs.items():
+            yield from flatten_specs(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(specs, list):
+        for value in specs:
+            yield from flatten_specs(value, prefix)
+    elif specs is not None and prefix:
+        yield prefix, specs
+
+
+def spec_text(value):
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def spec_integer(value):
+    # Integral numbers that fit the 32-bit value_num column, as ProductSpec.from_spec
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if isinstance(value, float) and not value.is_integer():
+        return None
+    value = int(value)
+    return value if -2**31 <= value <= 2**31 - 1 else None
+
+
+def backfill_product_specs(apps, schema_editor):
+    BaseProduct = apps.get_model('products', 'BaseProduct')
+    ProductSpec = apps.get_model('products', 'ProductSpec')
+    rows = []
+    for product in BaseProduct.objects.only('id', 'specs').iterator(chunk_size=500):
+        for key, value in flatten_specs(product.specs or {}):
+            rows.append(ProductSpec(
+                base_product_id=product.pk,
+                key=key[:64],
+                value_text=spec_text(value)[:128],
+                value_num=spec_integer(value)
+            ))
+        # Insert as we go instead of holding every product's rows in memory
+        if len(rows) >= 1000:
+            ProductSpec.objects.bulk_create(rows)
+            rows = []
+    ProductSpec.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_alter_image_base_product'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSpec',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Dotted path of the spec, e.g. processor.model', max_length=64)),
+                ('value_text', models.CharField(help_text='Spec value as text', max_length=128)),
+                ('value_num', models.IntegerField(blank=True, help_text='Spec value as a number, when it is an integer that fits the column', null=True)),
+                ('base_product', models.ForeignKey(help_text='Base product to which the spec belongs', on_delete=django.db.models.deletion.CASCADE, related_name='spec_rows', to='products.baseproduct')),
+            ],
+            options={
+                'verbose_name': 'Product Spec',
+                'verbose_name_plural': 'Product Specs',
+                'indexes': [models.Index(fields=['key', 'value_text'], name='productspec_key_text_idx'), models.Index(fields=['key', 'value_num'], name='productspec_key_num_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_product_specs, migrations.RunPython.noop),
+    ]
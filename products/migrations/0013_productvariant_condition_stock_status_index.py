@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_productspec'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productvariant',
+            name='condition',
+            field=models.CharField(choices=[('nuevo', 'Nuevo'), ('open_box', 'Open Box'), ('refurbished', 'Refurbished'), ('usado', 'Usado')], db_index=True, default='nuevo', help_text='Condition of the product', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='productvariant',
+            name='stock_status',
+            field=models.CharField(choices=[('en_stock', 'En Stock'), ('en_camino', 'En Camino'), ('por_importacion', 'Por Importación'), ('sin_stock', 'Sin Stock')], db_index=True, default='en_stock', help_text='Product stock status', max_length=20),
+        ),
+    ]
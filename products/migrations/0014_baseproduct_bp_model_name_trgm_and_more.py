@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:30
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_productvariant_condition_stock_status_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('model_name'), name='gin_trgm_ops'), name='bp_model_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('long_description'), name='gin_trgm_ops'), name='bp_long_description_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='baseproduct',
+            index=models.Index(fields=['-creation_date'], name='bp_created_idx'),
+        ),
+    ]
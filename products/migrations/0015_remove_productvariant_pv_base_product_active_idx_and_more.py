@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0014_baseproduct_bp_model_name_trgm_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='productvariant',
+            name='pv_base_product_active_idx',
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(fields=['base_product', 'is_published', 'active', 'price'], name='pv_base_product_listing_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 13:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0015_remove_productvariant_pv_base_product_active_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='brand',
+            name='update_date',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='update_date',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
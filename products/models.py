@@ -1,8 +1,12 @@
+import json
+import re
 import uuid
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.conf import settings
-from django.utils.text import slugify
 from core.models import BaseModel
+from .utils import fast_slugify
 
 def get_image_upload_path(instance, filename):
     """Generates a unique path for every image."""
@@ -11,10 +15,88 @@ def get_image_upload_path(instance, filename):
     return f'products/images/{filename}'
 
 
+# Spec leaves promoted to their own columns so BaseProductFilter can hit indexes
+# instead of extracting them from the specs JSON on every row.
+SPEC_FIELD_PATHS = {
+    'processor_model': ('processor', 'model'),
+    'processor_cores': ('processor', 'cores'),
+    'screen_size': ('screen', 'size'),
+    'screen_resolution': ('screen', 'resolution'),
+    'screen_refresh_rate': ('screen', 'refresh_rate'),
+    'memory_size': ('memory', 'size'),
+    'memory_type': ('memory', 'type'),
+    'graphics_model': ('graphics', 'model'),
+    'graphics_vram': ('graphics', 'vram'),
+    'storage_size': ('storage', 'size'),
+    'storage_type': ('storage', 'type'),
+    'weight': ('weight',),
+    'battery': ('battery',),
+}
+
+
+# Spec counts (processor_cores) accepted into the smallint column, as in the 0007 backfill
+SPEC_COUNT_RE = re.compile(r'[0-9]{1,4}')
+
+
+def trigram_index(field_name):
+    """
+    Trigram index over UPPER(field_name), the expression Postgres evaluates
+    for icontains lookups, so partial-match filters and search become index scans.
+    """
+    return GinIndex(
+        OpClass(Upper(field_name), name='gin_trgm_ops'),
+        name=f'bp_{field_name}_trgm',
+    )
+
+
+def flatten_specs(specs, prefix=''):
+    """Yields (key, value) pairs for every leaf of the specs JSON, using dotted keys."""
+    if isinstance(specs, dict):
+        for key, value in specs.items():
+            yield from flatten_specs(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(specs, list):
+        for value in specs:
+            yield from flatten_specs(value, prefix)
+    elif specs is not None and prefix:
+        yield prefix, specs
+
+
+def spec_text(value):
+    """
+    Text form of a spec value, matching Postgres' ->> output: strings as they
+    are, anything else (numbers, booleans, objects) as JSON.
+    """
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def spec_integer(value, min_value, max_value):
+    """
+    Returns value as an int when it is an integral JSON number between
+    min_value and max_value, otherwise None. 15.6 is not truncated to 15.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if isinstance(value, float) and not value.is_integer():
+        return None
+    value = int(value)
+    return value if min_value <= value <= max_value else None
+
+
+def get_spec_value(specs, path):
+    """Returns the value found at the given path inside specs, or None."""
+    value = specs
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
 class Brand(BaseModel):
     """Model that represents a brand, ej: ASUS, MSI, NVIDIA."""
     name = models.CharField(max_length=100, null=False, unique=True, help_text="Brand's name")
     slug = models.SlugField(max_length=120, unique=True, blank=True, help_text="URL slug, auto-generated")
+    update_date = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Brand"
@@ -23,7 +105,7 @@ class Brand(BaseModel):
     
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = fast_slugify(self.name)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -35,6 +117,7 @@ class Category(BaseModel):
     name = models.CharField(max_length=100, unique=True, null=False, help_text="Categorys name")
     slug = models.SlugField(max_length=120, unique=True, blank=True, help_text="URL slug, auto-generated")
     description = models.TextField(blank=True, null=True, help_text="Optional description of the category")
+    update_date = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Category"
@@ -43,7 +126,7 @@ class Category(BaseModel):
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = fast_slugify(self.name)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -58,6 +141,22 @@ class BaseProduct(BaseModel):
     brand = models.ForeignKey(Brand, on_delete=models.PROTECT, related_name="base_products", null=False, help_text="Brand to which the product belongs")
     categories = models.ManyToManyField(Category, related_name="base_products", help_text="Categories to which the product belongs")
     specs = models.JSONField(default=dict, null=False, help_text="Product specifications in JSON format")
+
+    # Denormalized from specs, kept in sync on save
+    processor_model = models.CharField(max_length=255, blank=True, default='', editable=False, help_text="Processor model, copied from specs")
+    processor_cores = models.PositiveSmallIntegerField(blank=True, null=True, db_index=True, editable=False, help_text="Processor cores, copied from specs")
+    screen_size = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Screen size, copied from specs")
+    screen_resolution = models.CharField(max_length=100, blank=True, default='', editable=False, help_text="Screen resolution, copied from specs")
+    screen_refresh_rate = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Screen refresh rate, copied from specs")
+    memory_size = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Memory size, copied from specs")
+    memory_type = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Memory type, copied from specs")
+    graphics_model = models.CharField(max_length=255, blank=True, default='', editable=False, help_text="Graphics card model, copied from specs")
+    graphics_vram = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Graphics VRAM, copied from specs")
+    storage_size = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Storage size, copied from specs")
+    storage_type = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Storage type, copied from specs")
+    weight = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Weight, copied from specs")
+    battery = models.CharField(max_length=50, blank=True, default='', editable=False, help_text="Battery, copied from specs")
+
     user_last_modified = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.PROTECT,
@@ -65,23 +164,114 @@ class BaseProduct(BaseModel):
         help_text="Last user who modified this product"
     )
     creation_date = models.DateTimeField(auto_now_add=True)
-    update_date = models.DateTimeField(auto_now=True)
+    update_date = models.DateTimeField(auto_now=True, db_index=True)
  
 
     class Meta:
         verbose_name = "Base Product"
         verbose_name_plural = "Base Products"
-        ordering = ['-user_last_modified']
+        ordering = ['-update_date']
+        indexes = [
+            trigram_index(field_name)
+            for field_name in SPEC_FIELD_PATHS
+            if field_name != 'processor_cores'
+        ] + [
+            # ?model_name= and ?search= (model_name, long_description)
+            trigram_index('model_name'),
+            trigram_index('long_description'),
+            # Default listing order (-creation_date), which the list applies unfiltered
+            models.Index(fields=['-creation_date'], name='bp_created_idx'),
+        ]
+
+    def sync_spec_fields(self):
+        """
+        Copies the filterable spec leaves from specs into their own columns,
+        with the same rules as the SQL backfill in migration 0007.
+        """
+        specs = self.specs or {}
+        for field_name, path in SPEC_FIELD_PATHS.items():
+            value = get_spec_value(specs, path)
+            text = None if value is None else spec_text(value)
+            field = self._meta.get_field(field_name)
+            if isinstance(field, models.PositiveSmallIntegerField):
+                # Out of range or non-numeric counts are stored as NULL instead of failing the save
+                value = int(text) if text is not None and SPEC_COUNT_RE.fullmatch(text) else None
+            else:
+                value = '' if text is None else text[:field.max_length]
+            setattr(self, field_name, value)
+
+    def get_brand_name(self):
+        """Returns the brand's name without loading the whole brand if it isn't cached."""
+        if self._meta.get_field('brand').is_cached(self):
+            return self.brand.name
+        return Brand.objects.filter(pk=self.brand_id).values_list('name', flat=True).get()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded specs so save() only rebuilds spec rows when they change
+        instance._loaded_specs = instance.__dict__.get('specs')
+        return instance
+
+    def sync_spec_rows(self):
+        """Rebuilds the ProductSpec rows from specs."""
+        self.spec_rows.all().delete()
+        ProductSpec.objects.bulk_create([
+            ProductSpec.from_spec(self, key, value)
+            for key, value in flatten_specs(self.specs or {})
+        ])
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(f"{self.brand.name}-{self.model_name}")
+            self.slug = fast_slugify(f"{self.get_brand_name()}-{self.model_name}")
+        specs_loaded = 'specs' not in self.get_deferred_fields()
+        if specs_loaded:
+            self.sync_spec_fields()
         super().save(*args, **kwargs)
+        if specs_loaded and self.specs != getattr(self, '_loaded_specs', None):
+            self.sync_spec_rows()
+            self._loaded_specs = self.specs
 
     def __str__(self):
         return f"{self.brand.name} - {self.model_name}"
 
 
+# Range of ProductSpec.value_num (a 32-bit IntegerField)
+VALUE_NUM_RANGE = (-2**31, 2**31 - 1)
+
+
+class ProductSpec(models.Model):
+    """
+    Flattened spec entry of a BaseProduct, one row per leaf of its specs JSON.
+    Allows indexed filtering on any spec key, e.g. key='connectivity', value_text='WiFi 6'.
+    """
+    base_product = models.ForeignKey(BaseProduct, on_delete=models.CASCADE, related_name="spec_rows", help_text="Base product to which the spec belongs")
+    key = models.CharField(max_length=64, help_text="Dotted path of the spec, e.g. processor.model")
+    value_text = models.CharField(max_length=128, help_text="Spec value as text")
+    value_num = models.IntegerField(blank=True, null=True, help_text="Spec value as a number, when it is an integer that fits the column")
+
+    class Meta:
+        verbose_name = "Product Spec"
+        verbose_name_plural = "Product Specs"
+        indexes = [
+            models.Index(fields=['key', 'value_text'], name='productspec_key_text_idx'),
+            models.Index(fields=['key', 'value_num'], name='productspec_key_num_idx'),
+        ]
+
+    @classmethod
+    def from_spec(cls, base_product, key, value):
+        """Builds an unsaved row for the given flattened spec."""
+        return cls(
+            base_product=base_product,
+            key=key[:64],
+            value_text=spec_text(value)[:128],
+            value_num=spec_integer(value, *VALUE_NUM_RANGE)
+        )
+
+    def __str__(self):
+        return f"{self.key}: {self.value_text}"
+
+
 class ProductVariant(BaseModel):
     """Represents a specific variant of a BaseProduct, differentiated by condition, stock status, price, etc."""
     class ConditionChoices(models.TextChoices):
@@ -98,8 +288,8 @@ class ProductVariant(BaseModel):
 
     base_product = models.ForeignKey(BaseProduct, on_delete=models.PROTECT, related_name="product_variants", help_text="Base product to which this variant belongs")
     price = models.IntegerField(null=False, help_text="Selling price of the variant")
-    condition = models.CharField(null=False, max_length=20, choices=ConditionChoices.choices, default=ConditionChoices.NEW, help_text="Condition of the product")
-    stock_status = models.CharField(null=False, max_length=20, choices=StatusStockChoices.choices, default=StatusStockChoices.IN_STOCK, help_text="Product stock status")
+    condition = models.CharField(null=False, max_length=20, choices=ConditionChoices.choices, default=ConditionChoices.NEW, db_index=True, help_text="Condition of the product")
+    stock_status = models.CharField(null=False, max_length=20, choices=StatusStockChoices.choices, default=StatusStockChoices.IN_STOCK, db_index=True, help_text="Product stock status")
     is_published = models.BooleanField(default=True, null=False, help_text="Indicates whether the variant is visible in the store")
     user_last_modified = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -114,14 +304,33 @@ class ProductVariant(BaseModel):
         verbose_name = "Product Variant"
         verbose_name_plural = "Product Variants"
         ordering = ['price', 'condition']
+        indexes = [
+            models.Index(fields=['price', 'condition'], name='pv_price_condition_idx'),
+            # Storefront listing: only visible variants, filtered by stock and price range
+            models.Index(
+                fields=['stock_status', 'price'],
+                name='pv_listing_idx',
+                condition=models.Q(is_published=True, active=True),
+            ),
+            # Variants of one product (?base_product=), narrowed by visibility and walked in price order
+            models.Index(fields=['base_product', 'is_published', 'active', 'price'], name='pv_base_product_listing_idx'),
+        ]
 
     def __str__(self):
         return f"{self.base_product.model_name} ({self.get_condition_display()}) - {self.pk}"
 
+    def get_active_discount(self):
+        """Returns the variant's discount if it exists and is active, otherwise None."""
+        try:
+            discount = self.discount
+        except ProductVariant.discount.RelatedObjectDoesNotExist:
+            return None
+        return discount if discount.active else None
+
 
 class Image(BaseModel):
     """Model to save the images that belongs to the product."""
-    base_product = models.ForeignKey(BaseProduct, on_delete=models.ProtectedError, related_name="images", help_text="Variant to which the image belongs")
+    base_product = models.ForeignKey(BaseProduct, on_delete=models.PROTECT, related_name="images", help_text="Base product to which the image belongs")
     imagen = models.ImageField(upload_to=get_image_upload_path, help_text="Product' image")
     alt_text = models.CharField(max_length=255, blank=True, null=True, help_text="Texto alternativo para la imagen (SEO)")
 
@@ -130,7 +339,7 @@ class Image(BaseModel):
         verbose_name_plural = "Images"
 
     def __str__(self):
-        return f"Image for {self.product_variant.pk}"
+        return f"Image for {self.base_product_id}"
     
 
 class Discount(models.Model):
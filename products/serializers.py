@@ -1,5 +1,60 @@
 from rest_framework import serializers
-from .models import Brand, Category, BaseProduct, Image, ProductVariant
+from rest_framework.fields import empty
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, FilteredRelation, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from .models import Brand, Category, BaseProduct, Image, ProductVariant, SPEC_FIELD_PATHS
+from .utils import validate_image_max_size, decode_image, optimize_image
+
+MAX_IMAGES_PER_PRODUCT = 4
+
+# Choice labels, looked up directly instead of through get_FOO_display() per row
+CONDITION_LABELS = dict(ProductVariant.ConditionChoices.choices)
+STOCK_STATUS_LABELS = dict(ProductVariant.StatusStockChoices.choices)
+
+# Only active related objects can be selected; the filter runs in the lookup query
+ACTIVE_BRAND_KWARGS = {
+    'queryset': Brand.objects.filter(active=True),
+    'error_messages': {'does_not_exist': 'The selected brand does not exist or is inactive.'},
+}
+ACTIVE_BASE_PRODUCT_KWARGS = {
+    'queryset': BaseProduct.objects.filter(active=True),
+    'error_messages': {'does_not_exist': 'The selected base product does not exist or is inactive.'},
+}
+
+
+def apply_changes(instance, validated_data, field_names):
+    """
+    Set the given fields from validated_data on the instance.
+    Returns the names of the fields whose value actually changed.
+    """
+    changed_fields = []
+    for field_name in field_names:
+        if field_name not in validated_data:
+            continue
+        value = validated_data[field_name]
+        field = instance._meta.get_field(field_name)
+        if field.is_relation:
+            # Compare ids so the current related object isn't fetched
+            current, new = getattr(instance, field.attname), getattr(value, 'pk', None)
+        else:
+            current, new = getattr(instance, field_name), value
+        if current != new:
+            setattr(instance, field_name, value)
+            changed_fields.append(field_name)
+    return changed_fields
+
+
+def validate_category_ids(value):
+    """Validate that all category IDs exist and are active."""
+    found = Category.objects.filter(pk__in=value, active=True).values_list('pk', flat=True)
+    missing = set(value) - set(found)
+    if missing:
+        raise serializers.ValidationError(
+            f"One or more category IDs are invalid or inactive: {sorted(missing)}."
+        )
+    return value
 
 
 class BrandSerializer(serializers.ModelSerializer):
@@ -37,9 +92,10 @@ class BrandUpdateSerializer(serializers.ModelSerializer):
         fields = ['name']
 
     def update(self, instance, validated_data):
-        """Update and return the brand instance."""
-        instance.name = validated_data.get('name', instance.name)
-        instance.save()
+        """Update and return the brand instance, saving only if something changed."""
+        changed_fields = apply_changes(instance, validated_data, ['name'])
+        if changed_fields:
+            instance.save(update_fields=changed_fields + ['update_date'])
         return instance
 
 
@@ -85,23 +141,52 @@ class CategoryUpdateSerializer(serializers.ModelSerializer):
         }
 
     def update(self, instance, validated_data):
-        """Update and return the category instance."""
-        instance.name = validated_data.get('name', instance.name)
-        instance.description = validated_data.get('description', instance.description)
-        instance.save()
+        """Update and return the category instance, saving only if something changed."""
+        changed_fields = apply_changes(instance, validated_data, ['name', 'description'])
+        if changed_fields:
+            instance.save(update_fields=changed_fields + ['update_date'])
         return instance
 
 
 # BaseProduct Serializers
 
-class ImageSerializer(serializers.ModelSerializer):
+class DecodedImageField(serializers.ImageField):
     """
-    Serializer for Image model.
+    ImageField that validates the upload by decoding it (see decode_image)
+    instead of running Pillow's verify() pass. Decoding runs after the field
+    validators, so oversized files are rejected first. The decoded image is
+    kept on the file as .image, so encode_images needs no second decode.
     """
-    class Meta:
-        model = Image
-        fields = ['id', 'imagen', 'alt_text', 'active']
-        read_only_fields = ['id']
+    def to_internal_value(self, data):
+        return serializers.FileField.to_internal_value(self, data)
+
+    def run_validation(self, data=empty):
+        file_object = super().run_validation(data)
+        if file_object is not None:
+            try:
+                file_object.image = decode_image(file_object)
+            except DjangoValidationError:
+                self.fail('invalid_image')
+        return file_object
+
+
+class ImageUploadSerializer(serializers.Serializer):
+    """
+    Serializer for a single uploaded image and its alt text.
+    """
+    imagen = DecodedImageField(validators=[validate_image_max_size])
+    alt_text = serializers.CharField(required=False, allow_blank=True, max_length=255)
+
+
+def encode_images(images_data):
+    """
+    Swap each validated upload for a resized WEBP version instead of the raw
+    upload. Called from create()/update(), so nothing is encoded for an
+    invalid request.
+    """
+    for image_data in images_data:
+        image_data['imagen'] = optimize_image(image_data['imagen'].image)
+    return images_data
 
 
 class BaseProductCreateSerializer(serializers.ModelSerializer):
@@ -109,17 +194,14 @@ class BaseProductCreateSerializer(serializers.ModelSerializer):
     Serializer for creating a new BaseProduct with images.
     Accepts up to 4 images as file uploads.
     """
-    # Image fields for file uploads (up to 4 images)
-    image_1 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_2 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_3 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_4 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-
-    # Alt text for each image
-    alt_text_1 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_2 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_3 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_4 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
+    # Image uploads (up to 4), sent as images[0]imagen, images[0]alt_text, ...
+    images = serializers.ListField(
+        child=ImageUploadSerializer(),
+        write_only=True,
+        required=False,
+        max_length=MAX_IMAGES_PER_PRODUCT,
+        help_text="List of images with their alt text"
+    )
 
     # Categories as list of IDs
     categories = serializers.ListField(
@@ -137,10 +219,10 @@ class BaseProductCreateSerializer(serializers.ModelSerializer):
             'brand',
             'categories',
             'specs',
-            'image_1', 'image_2', 'image_3', 'image_4',
-            'alt_text_1', 'alt_text_2', 'alt_text_3', 'alt_text_4'
+            'images'
         ]
         extra_kwargs = {
+            'brand': ACTIVE_BRAND_KWARGS,
             'specs': {'required': True},
         }
 
@@ -149,18 +231,7 @@ class BaseProductCreateSerializer(serializers.ModelSerializer):
         if not value:
             raise serializers.ValidationError("At least one category is required.")
 
-        # Check if all category IDs exist
-        existing_categories = Category.objects.filter(id__in=value, active=True)
-        if existing_categories.count() != len(value):
-            raise serializers.ValidationError("One or more category IDs are invalid or inactive.")
-
-        return value
-
-    def validate_brand(self, value):
-        """Validate that the brand is active."""
-        if not value.active:
-            raise serializers.ValidationError("The selected brand is inactive.")
-        return value
+        return validate_category_ids(value)
 
     def validate_specs(self, value):
         """Validate that specs is a valid JSON object."""
@@ -168,15 +239,11 @@ class BaseProductCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Specs must be a valid JSON object.")
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
         """Create BaseProduct with images."""
         # Extract image data
-        images_data = []
-        for i in range(1, 5):
-            image_file = validated_data.pop(f'image_{i}', None)
-            alt_text = validated_data.pop(f'alt_text_{i}', '')
-            if image_file:
-                images_data.append({'imagen': image_file, 'alt_text': alt_text})
+        images_data = encode_images(validated_data.pop('images', []))
 
         # Extract categories
         category_ids = validated_data.pop('categories')
@@ -190,16 +257,18 @@ class BaseProductCreateSerializer(serializers.ModelSerializer):
             user_last_modified=user
         )
 
-        # Add categories
-        base_product.categories.set(category_ids)
-        print(images_data)
+        # Add categories (fresh product, so insert the links directly instead of set())
+        CategoryLink = BaseProduct.categories.through
+        CategoryLink.objects.bulk_create([
+            CategoryLink(baseproduct_id=base_product.pk, category_id=category_id)
+            for category_id in dict.fromkeys(category_ids)
+        ])
 
         # Create images
-        for image_data in images_data:
-            Image.objects.create(
-                base_product=base_product,
-                **image_data
-            )
+        Image.objects.bulk_create([
+            Image(base_product=base_product, **image_data)
+            for image_data in images_data
+        ])
 
         return base_product
 
@@ -208,10 +277,16 @@ class BaseProductSerializer(serializers.ModelSerializer):
     """
     Serializer for BaseProduct listing and retrieval.
     Includes related brand, categories, and images.
+
+    Querysets serialized with many=True must go through setup_eager_loading,
+    otherwise every row issues its own brand, categories and images queries.
+
+    Related objects are rendered as plain dicts (brand and categories with the same
+    shape as BrandSerializer and CategorySerializer) to skip nested serializer binding per row.
     """
-    brand = BrandSerializer(read_only=True)
-    categories = CategorySerializer(many=True, read_only=True)
-    images = ImageSerializer(many=True, read_only=True)
+    brand = serializers.SerializerMethodField()
+    categories = serializers.SerializerMethodField()
+    images = serializers.SerializerMethodField()
 
     class Meta:
         model = BaseProduct
@@ -229,23 +304,132 @@ class BaseProductSerializer(serializers.ModelSerializer):
             'images'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the brand, categories and images this serializer nests, avoiding N+1 queries.
+        Every column of the nested rows is rendered, so only the image order is set.
+        """
+        return queryset.select_related('brand').prefetch_related(
+            'categories',
+            Prefetch('images', queryset=Image.objects.order_by('id'))
+        )
+
+    def get_image_url(self, image):
+        """Return the image URL, absolute when the request is available."""
+        return self.get_file_url(image.imagen.name)
+
+    def get_file_url(self, name):
+        """Return the URL of a stored image file name, absolute when the request is available."""
+        if not name:
+            return None
+        url = Image._meta.get_field('imagen').storage.url(name)
+        request = self.context.get('request')
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    def get_brand(self, obj):
+        brand = obj.brand
+        return {'id': brand.id, 'name': brand.name, 'slug': brand.slug, 'active': brand.active}
+
+    def get_categories(self, obj):
+        return [
+            {
+                'id': category.id,
+                'name': category.name,
+                'slug': category.slug,
+                'description': category.description,
+                'active': category.active
+            }
+            for category in obj.categories.all()
+        ]
+
+    def get_images(self, obj):
+        return [
+            {
+                'id': image.id,
+                'imagen': self.get_image_url(image),
+                'alt_text': image.alt_text,
+                'active': image.active
+            }
+            for image in obj.images.all()
+        ]
+
+
+class BaseProductListSerializer(BaseProductSerializer):
+    """
+    Lightweight serializer for BaseProduct listings.
+    Categories are rendered by name and only the first image, as a URL.
+    The heavy specs and long_description fields are left out.
+    """
+    categories = serializers.SlugRelatedField(many=True, read_only=True, slug_field='name')
+    primary_image = serializers.SerializerMethodField()
+
+    class Meta(BaseProductSerializer.Meta):
+        fields = [
+            'id',
+            'model_name',
+            'slug',
+            'brand',
+            'categories',
+            'active',
+            'creation_date',
+            'update_date',
+            'primary_image'
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Same brand and categories as the full serializer, loading only the columns
+        rendered here. The first image is annotated by a subquery instead of
+        prefetching every image of the page.
+        """
+        first_image = Image.objects.filter(base_product=OuterRef('pk')).order_by('id').values('imagen')[:1]
+        return queryset.select_related('brand').prefetch_related(
+            Prefetch('categories', queryset=Category.objects.only('id', 'name'))
+        ).annotate(primary_image=Subquery(first_image)).only(
+            'id', 'model_name', 'slug', 'active', 'creation_date', 'update_date', 'brand'
+        )
+
+    def to_representation(self, instance):
+        """
+        Build each row directly from the eager-loaded instance, skipping the
+        per-field get_attribute/to_representation dispatch for every row.
+        The output matches the declared fields.
+        """
+        fields = self.fields
+        return {
+            'id': instance.id,
+            'model_name': instance.model_name,
+            'slug': instance.slug,
+            'brand': self.get_brand(instance),
+            'categories': [category.name for category in instance.categories.all()],
+            'active': instance.active,
+            'creation_date': fields['creation_date'].to_representation(instance.creation_date),
+            'update_date': fields['update_date'].to_representation(instance.update_date),
+            'primary_image': self.get_primary_image(instance)
+        }
+
+    def get_primary_image(self, obj):
+        """Return the URL of the product's first image, or None when it has none."""
+        return self.get_file_url(obj.primary_image)
+
 
 class BaseProductUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating BaseProduct.
     Allows updating images by adding/removing them.
     """
-    # Image fields for file uploads (up to 4 new images)
-    image_1 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_2 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_3 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-    image_4 = serializers.ImageField(write_only=True, required=False, allow_null=True)
-
-    # Alt text for each image
-    alt_text_1 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_2 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_3 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
-    alt_text_4 = serializers.CharField(write_only=True, required=False, allow_blank=True, max_length=255)
+    # New image uploads (up to 4), sent as images[0]imagen, images[0]alt_text, ...
+    images = serializers.ListField(
+        child=ImageUploadSerializer(),
+        write_only=True,
+        required=False,
+        max_length=MAX_IMAGES_PER_PRODUCT,
+        help_text="List of new images with their alt text"
+    )
 
     # Categories as list of IDs
     categories = serializers.ListField(
@@ -271,29 +455,20 @@ class BaseProductUpdateSerializer(serializers.ModelSerializer):
             'brand',
             'categories',
             'specs',
-            'image_1', 'image_2', 'image_3', 'image_4',
-            'alt_text_1', 'alt_text_2', 'alt_text_3', 'alt_text_4',
+            'images',
             'remove_images'
         ]
         extra_kwargs = {
             'model_name': {'required': False},
             'long_description': {'required': False},
-            'brand': {'required': False},
+            'brand': {'required': False, **ACTIVE_BRAND_KWARGS},
             'specs': {'required': False},
         }
 
     def validate_categories(self, value):
         """Validate that all category IDs exist and are active."""
         if value:
-            existing_categories = Category.objects.filter(id__in=value, active=True)
-            if existing_categories.count() != len(value):
-                raise serializers.ValidationError("One or more category IDs are invalid or inactive.")
-        return value
-
-    def validate_brand(self, value):
-        """Validate that the brand is active."""
-        if value and not value.active:
-            raise serializers.ValidationError("The selected brand is inactive.")
+            validate_category_ids(value)
         return value
 
     def validate_specs(self, value):
@@ -302,15 +477,11 @@ class BaseProductUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Specs must be a valid JSON object.")
         return value
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """Update BaseProduct with new data and handle images."""
         # Extract image data
-        images_data = []
-        for i in range(1, 5):
-            image_file = validated_data.pop(f'image_{i}', None)
-            alt_text = validated_data.pop(f'alt_text_{i}', '')
-            if image_file:
-                images_data.append({'imagen': image_file, 'alt_text': alt_text})
+        images_data = encode_images(validated_data.pop('images', []))
 
         # Handle image removal
         remove_images = validated_data.pop('remove_images', [])
@@ -323,24 +494,27 @@ class BaseProductUpdateSerializer(serializers.ModelSerializer):
         # Get user from context
         user = self.context['request'].user
 
-        # Update basic fields
-        instance.model_name = validated_data.get('model_name', instance.model_name)
-        instance.long_description = validated_data.get('long_description', instance.long_description)
-        instance.brand = validated_data.get('brand', instance.brand)
-        instance.specs = validated_data.get('specs', instance.specs)
-        instance.user_last_modified = user
-        instance.save()
+        # Update basic fields, writing only the columns that changed
+        changed_fields = apply_changes(
+            instance, validated_data, ['model_name', 'long_description', 'brand', 'specs']
+        )
+        if 'specs' in changed_fields:
+            changed_fields += list(SPEC_FIELD_PATHS)
+
+        # Category and image changes also count, so update_date reflects them
+        if changed_fields or category_ids is not None or images_data or remove_images:
+            instance.user_last_modified = user
+            instance.save(update_fields=changed_fields + ['user_last_modified', 'update_date'])
 
         # Update categories if provided
         if category_ids is not None:
             instance.categories.set(category_ids)
 
         # Add new images
-        for image_data in images_data:
-            Image.objects.create(
-                base_product=instance,
-                **image_data
-            )
+        Image.objects.bulk_create([
+            Image(base_product=instance, **image_data)
+            for image_data in images_data
+        ])
 
         return instance
 
@@ -351,10 +525,15 @@ class ProductVariantSerializer(serializers.ModelSerializer):
     """
     Serializer for ProductVariant listing and retrieval.
     Includes related base product information.
+
+    Querysets serialized with many=True must go through setup_eager_loading,
+    which also annotates the discount fields read by this serializer.
     """
     base_product = BaseProductSerializer(read_only=True)
-    condition_display = serializers.CharField(source='get_condition_display', read_only=True)
-    stock_status_display = serializers.CharField(source='get_stock_status_display', read_only=True)
+    condition_display = serializers.SerializerMethodField()
+    stock_status_display = serializers.SerializerMethodField()
+    effective_price = serializers.SerializerMethodField()
+    has_discount = serializers.SerializerMethodField()
 
     class Meta:
         model = ProductVariant
@@ -362,6 +541,8 @@ class ProductVariantSerializer(serializers.ModelSerializer):
             'id',
             'base_product',
             'price',
+            'effective_price',
+            'has_discount',
             'condition',
             'condition_display',
             'stock_status',
@@ -372,6 +553,73 @@ class ProductVariantSerializer(serializers.ModelSerializer):
             'update_date'
         ]
 
+    @classmethod
+    def annotate_discount(cls, queryset):
+        """Annotate the discounted price through a single JOIN on the active discount."""
+        return queryset.annotate(
+            active_discount=FilteredRelation('discount', condition=Q(discount__active=True))
+        ).annotate(
+            effective_price=Coalesce('active_discount__discount_price', 'price'),
+            has_discount=ExpressionWrapper(Q(active_discount__isnull=False), output_field=BooleanField())
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the nested base product relations, avoiding N+1 queries,
+        and annotate the discounted price.
+        """
+        return cls.annotate_discount(queryset).select_related('base_product__brand').prefetch_related(
+            'base_product__categories',
+            Prefetch('base_product__images', queryset=Image.objects.order_by('id'))
+        )
+
+    def get_condition_display(self, obj):
+        return CONDITION_LABELS.get(obj.condition, obj.condition)
+
+    def get_stock_status_display(self, obj):
+        return STOCK_STATUS_LABELS.get(obj.stock_status, obj.stock_status)
+
+    def get_effective_price(self, obj):
+        """Price after applying the active discount, if any."""
+        if hasattr(obj, 'effective_price'):
+            return obj.effective_price
+        discount = obj.get_active_discount()
+        return discount.discount_price if discount else obj.price
+
+    def get_has_discount(self, obj):
+        """Whether the variant has an active discount."""
+        if hasattr(obj, 'has_discount'):
+            return obj.has_discount
+        return obj.get_active_discount() is not None
+
+
+class ProductVariantListSerializer(ProductVariantSerializer):
+    """
+    Lightweight serializer for ProductVariant listings.
+    The base product is summarized (id, model name, slug and brand name)
+    instead of nesting its categories, images and specs.
+    """
+    base_product = serializers.SerializerMethodField()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the base product and brand, loading only the columns rendered here."""
+        return cls.annotate_discount(queryset).select_related('base_product__brand').only(
+            'id', 'price', 'condition', 'stock_status', 'is_published', 'active',
+            'creation_date', 'update_date', 'base_product',
+            'base_product__model_name', 'base_product__slug', 'base_product__brand__name'
+        )
+
+    def get_base_product(self, obj):
+        base_product = obj.base_product
+        return {
+            'id': base_product.id,
+            'model_name': base_product.model_name,
+            'slug': base_product.slug,
+            'brand_name': base_product.brand.name
+        }
+
 
 class ProductVariantCreateSerializer(serializers.ModelSerializer):
     """
@@ -386,12 +634,9 @@ class ProductVariantCreateSerializer(serializers.ModelSerializer):
             'stock_status',
             'is_published'
         ]
-
-    def validate_base_product(self, value):
-        """Validate that the base product exists and is active."""
-        if not value.active:
-            raise serializers.ValidationError("The selected base product is inactive.")
-        return value
+        extra_kwargs = {
+            'base_product': ACTIVE_BASE_PRODUCT_KWARGS,
+        }
 
     def validate_price(self, value):
         """Validate that the price is positive."""
@@ -428,19 +673,13 @@ class ProductVariantUpdateSerializer(serializers.ModelSerializer):
             'is_published'
         ]
         extra_kwargs = {
-            'base_product': {'required': False},
+            'base_product': {'required': False, **ACTIVE_BASE_PRODUCT_KWARGS},
             'price': {'required': False},
             'condition': {'required': False},
             'stock_status': {'required': False},
             'is_published': {'required': False}
         }
 
-    def validate_base_product(self, value):
-        """Validate that the base product exists and is active."""
-        if value and not value.active:
-            raise serializers.ValidationError("The selected base product is inactive.")
-        return value
-
     def validate_price(self, value):
         """Validate that the price is positive."""
         if value is not None and value <= 0:
@@ -452,13 +691,26 @@ class ProductVariantUpdateSerializer(serializers.ModelSerializer):
         # Get user from context
         user = self.context['request'].user
 
-        # Update fields
-        instance.base_product = validated_data.get('base_product', instance.base_product)
-        instance.price = validated_data.get('price', instance.price)
-        instance.condition = validated_data.get('condition', instance.condition)
-        instance.stock_status = validated_data.get('stock_status', instance.stock_status)
-        instance.is_published = validated_data.get('is_published', instance.is_published)
-        instance.user_last_modified = user
-        instance.save()
+        # Update fields, writing only the columns that changed
+        changed_fields = apply_changes(
+            instance, validated_data, ['base_product', 'price', 'condition', 'stock_status', 'is_published']
+        )
+        if changed_fields:
+            instance.user_last_modified = user
+            instance.save(update_fields=changed_fields + ['user_last_modified', 'update_date'])
 
         return instance
+
+
+# Bulk action Serializers
+
+class BulkIdsSerializer(serializers.Serializer):
+    """
+    Serializer for the ID list sent to the bulk activate/deactivate/publish endpoints.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+        help_text="List of IDs to update"
+    )
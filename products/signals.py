@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Brand, Category
+from .cache import invalidate_brand_caches, invalidate_category_caches
+
+
+# Invalidation waits for the commit, so a concurrent request can't re-cache
+# the old rows while the write is still uncommitted.
+
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+def brand_changed(sender, **kwargs):
+    """Invalidates the cached brand list when a brand changes."""
+    transaction.on_commit(invalidate_brand_caches)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, **kwargs):
+    """Invalidates the cached category data when a category changes."""
+    transaction.on_commit(invalidate_category_caches)
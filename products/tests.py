@@ -1,3 +1,579 @@
-from django.test import TestCase
+import json
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.utils import timezone
+from django.urls import reverse
+from PIL import Image as PILImage
+from rest_framework import status
+from rest_framework.test import APITestCase
+from users.models import User
+from .models import Brand, Category, BaseProduct, Discount, Image, ProductSpec, ProductVariant
+from .serializers import ProductVariantSerializer
 
-# Create your tests here.
+
+def png_upload(name='laptop.png'):
+    """Returns a small, valid PNG upload."""
+    buffer = BytesIO()
+    PILImage.new('RGB', (32, 32), 'red').save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class ProductAPITestCase(APITestCase):
+    """Authenticated client plus a brand, a category and one product."""
+
+    def setUp(self):
+        # Signal-driven invalidation waits for on_commit, which TestCase never reaches
+        cache.clear()
+        self.user = User.objects.create_user(email='staff@example.com', password='secret-pass')
+        self.client.force_authenticate(self.user)
+        self.brand = Brand.objects.create(name='Lenovo')
+        self.category = Category.objects.create(name='Gaming')
+        self.product = BaseProduct.objects.create(
+            model_name='Lenovo LOQ 15', long_description='Gaming laptop', brand=self.brand
+        )
+        self.product.categories.add(self.category)
+
+
+class SpecColumnTests(ProductAPITestCase):
+    """Spec leaves copied into BaseProduct columns on save."""
+
+    def create_product(self, specs, model_name='Asus TUF A15'):
+        return BaseProduct.objects.create(
+            model_name=model_name, long_description='Gaming laptop', brand=self.brand, specs=specs
+        )
+
+    def test_columns_follow_specs(self):
+        product = self.create_product({
+            'processor': {'model': 'Ryzen 7 7735HS', 'cores': 8},
+            'memory': {'size': '16GB'},
+            'weight': 2.2,
+        })
+
+        self.assertEqual(product.processor_model, 'Ryzen 7 7735HS')
+        self.assertEqual(product.processor_cores, 8)
+        self.assertEqual(product.memory_size, '16GB')
+        self.assertEqual(product.weight, '2.2')
+        self.assertEqual(product.battery, '')
+
+    def test_out_of_range_cores_are_stored_as_null(self):
+        for cores in (-3, 40000, 8.5, True, 'eight'):
+            with self.subTest(cores=cores):
+                product = self.create_product({'processor': {'cores': cores}}, f'Asus TUF {cores}')
+                self.assertIsNone(product.processor_cores)
+
+    def test_numeric_string_cores_are_accepted(self):
+        product = self.create_product({'processor': {'cores': '16'}})
+
+        self.assertEqual(product.processor_cores, 16)
+
+    def test_non_string_values_are_stored_as_json(self):
+        product = self.create_product({'battery': True, 'screen': {'size': {'inches': 15.6}}})
+
+        self.assertEqual(product.battery, 'true')
+        self.assertEqual(product.screen_size, '{"inches": 15.6}')
+
+    def test_update_endpoint_resyncs_columns(self):
+        product = self.create_product({'processor': {'model': 'Ryzen 5 7535HS', 'cores': 6}})
+
+        response = self.client.patch(
+            reverse('baseproduct_update', args=[product.pk]),
+            {'specs': {'processor': {'model': 'Ryzen 7 7735HS', 'cores': 8}}}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        product.refresh_from_db()
+        self.assertEqual((product.processor_model, product.processor_cores), ('Ryzen 7 7735HS', 8))
+
+    def test_spec_filters_read_the_columns(self):
+        product = self.create_product({'processor': {'model': 'Intel Core i5', 'cores': 10}})
+
+        response = self.client.get(
+            reverse('baseproduct_list'), {'spec_processor_model': 'core i5', 'spec_processor_cores': 10}
+        )
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [product.pk])
+
+
+class ProductSpecTests(ProductAPITestCase):
+    """ProductSpec sidecar rows and the ?spec= filter built on them."""
+
+    def create_product(self, specs, model_name='Asus TUF A15'):
+        return BaseProduct.objects.create(
+            model_name=model_name, long_description='Gaming laptop', brand=self.brand, specs=specs
+        )
+
+    def spec_rows(self, product):
+        return {
+            row.key: (row.value_text, row.value_num)
+            for row in ProductSpec.objects.filter(base_product=product)
+        }
+
+    def test_rows_mirror_spec_leaves(self):
+        product = self.create_product({
+            'screen': {'size': 15.6},
+            'processor': {'cores': 16},
+            'touch': True,
+            'connectivity': ['WiFi 6'],
+            'storage': {'slots': 2 ** 40},
+        })
+
+        self.assertEqual(self.spec_rows(product), {
+            'screen.size': ('15.6', None),
+            'processor.cores': ('16', 16),
+            'touch': ('true', None),
+            'connectivity': ('WiFi 6', None),
+            'storage.slots': (str(2 ** 40), None),
+        })
+
+    def test_rows_are_rebuilt_when_specs_change(self):
+        product = self.create_product({'memory': {'size': '16GB'}})
+
+        product.specs = {'memory': {'size': '32GB'}}
+        product.save()
+
+        self.assertEqual(self.spec_rows(product), {'memory.size': ('32GB', None)})
+
+    def test_update_endpoint_rebuilds_rows(self):
+        product = self.create_product({'memory': {'size': '16GB'}, 'touch': False})
+
+        self.client.patch(
+            reverse('baseproduct_update', args=[product.pk]),
+            {'specs': {'memory': {'size': '32GB'}}}, format='json'
+        )
+
+        self.assertEqual(self.spec_rows(product), {'memory.size': ('32GB', None)})
+
+    def test_update_without_spec_changes_keeps_rows(self):
+        product = self.create_product({'memory': {'size': '16GB'}})
+        row_ids = set(ProductSpec.objects.filter(base_product=product).values_list('pk', flat=True))
+
+        self.client.patch(
+            reverse('baseproduct_update', args=[product.pk]), {'model_name': 'Asus TUF A16'}, format='json'
+        )
+
+        self.assertEqual(set(ProductSpec.objects.filter(base_product=product).values_list('pk', flat=True)), row_ids)
+
+    def test_spec_filter_matches_key_and_partial_value(self):
+        wifi = self.create_product({'connectivity': ['WiFi 6', 'USB-C']})
+        self.create_product({'connectivity': ['Bluetooth 5.2']}, model_name='HP Victus')
+
+        response = self.client.get(reverse('baseproduct_list'), {'spec': 'connectivity:wifi 6'})
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [wifi.pk])
+
+    def test_spec_filter_matches_numbers_by_text(self):
+        self.create_product({'screen': {'size': 15.6}})
+        sixteen = self.create_product({'screen': {'size': 16}}, model_name='HP Victus 16')
+
+        response = self.client.get(reverse('baseproduct_list'), {'spec': 'screen.size:16'})
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [sixteen.pk])
+
+
+class FlagToggleTests(ProductAPITestCase):
+    """Single-row activate/deactivate endpoints."""
+
+    def test_deactivate_returns_serialized_object(self):
+        response = self.client.post(reverse('brand_deactivate', args=[self.brand.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['brand']['active'], False)
+        self.brand.refresh_from_db()
+        self.assertFalse(self.brand.active)
+
+    def test_already_in_state_returns_400(self):
+        response = self.client.post(reverse('brand_activate', args=[self.brand.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_missing_row_returns_404(self):
+        response = self.client.post(reverse('brand_deactivate', args=[self.brand.pk + 1000]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_deactivate_bumps_update_date(self):
+        update_date = self.product.update_date
+
+        self.client.post(reverse('baseproduct_deactivate', args=[self.product.pk]))
+
+        self.product.refresh_from_db()
+        self.assertFalse(self.product.active)
+        self.assertGreater(self.product.update_date, update_date)
+
+    def test_deactivate_drops_cached_brand_list(self):
+        self.client.get(reverse('brand_list'))
+
+        self.client.post(reverse('brand_deactivate', args=[self.brand.pk]))
+
+        brands = self.client.get(reverse('brand_list')).json()
+        self.assertEqual(brands[0]['active'], False)
+
+
+    def test_unpublish_then_publish_variant(self):
+        variant = ProductVariant.objects.create(base_product=self.product, price=1000)
+
+        response = self.client.post(reverse('productvariant_unpublish', args=[variant.pk]))
+        self.assertEqual(response.json()['product_variant']['is_published'], False)
+
+        response = self.client.post(reverse('productvariant_publish', args=[variant.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        variant.refresh_from_db()
+        self.assertTrue(variant.is_published)
+
+class BulkToggleTests(ProductAPITestCase):
+    """Bulk endpoints update many rows and report how many changed."""
+
+    def test_bulk_deactivate_skips_unchanged_and_unknown_ids(self):
+        other = BaseProduct.objects.create(
+            model_name='Asus TUF A15', long_description='Gaming laptop', brand=self.brand, active=False
+        )
+
+        response = self.client.post(
+            reverse('baseproduct_bulk_deactivate'),
+            {'ids': [self.product.pk, other.pk, other.pk + 1000]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['updated'], 1)
+        self.assertFalse(BaseProduct.objects.filter(active=True).exists())
+
+    def test_bulk_unpublish_variants(self):
+        variants = ProductVariant.objects.bulk_create([
+            ProductVariant(base_product=self.product, price=price) for price in (1000, 2000)
+        ])
+
+        response = self.client.post(
+            reverse('productvariant_bulk_unpublish'),
+            {'ids': [variant.pk for variant in variants]}, format='json'
+        )
+
+        self.assertEqual(response.json()['updated'], 2)
+        self.assertFalse(ProductVariant.objects.filter(is_published=True).exists())
+
+    def test_empty_ids_returns_400(self):
+        response = self.client.post(reverse('brand_bulk_activate'), {'ids': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_id_returns_indexed_error(self):
+        response = self.client.post(
+            reverse('baseproduct_bulk_activate'), {'ids': ['x']}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('0', response.json()['ids'])
+
+
+class BaseProductCreateTests(ProductAPITestCase):
+    """Creating products from multipart uploads."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        cls.addClassCleanup(settings_override.disable)
+
+    def payload(self, **extra):
+        return {
+            'model_name': 'Lenovo Legion 5',
+            'long_description': 'Gaming laptop',
+            'brand': self.brand.pk,
+            'categories': [self.category.pk],
+            'specs': '{"processor": {"model": "Intel Core i7", "cores": 16}}',
+            **extra,
+        }
+
+    def test_create_with_images(self):
+        response = self.client.post(
+            reverse('baseproduct_create'),
+            self.payload(**{'images[0]imagen': png_upload(), 'images[0]alt_text': 'Front'}),
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        product = BaseProduct.objects.get(pk=response.json()['id'])
+        self.assertEqual(product.processor_model, 'Intel Core i7')
+        self.assertEqual(list(product.categories.all()), [self.category])
+        image = Image.objects.get(base_product=product)
+        self.assertEqual(image.alt_text, 'Front')
+        self.assertTrue(image.imagen.name.endswith('.webp'))
+
+    def test_echo_full_returns_product(self):
+        response = self.client.post(
+            reverse('baseproduct_create') + '?echo=full',
+            self.payload(**{'images[0]imagen': png_upload()}),
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        product = response.json()['product']
+        self.assertEqual(product['brand']['id'], self.brand.pk)
+        self.assertEqual(len(product['images']), 1)
+
+    def test_invalid_image_returns_indexed_error(self):
+        garbage = SimpleUploadedFile('laptop.png', b'not an image', content_type='image/png')
+
+        response = self.client.post(
+            reverse('baseproduct_create'), self.payload(**{'images[0]imagen': garbage}), format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('imagen', response.json()['images']['0'])
+        self.assertFalse(BaseProduct.objects.filter(model_name='Lenovo Legion 5').exists())
+
+    def test_invalid_category_item_returns_indexed_error(self):
+        response = self.client.post(
+            reverse('baseproduct_create'), self.payload(categories=['x']), format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('0', response.json()['categories'])
+
+
+    def test_invalid_request_does_not_encode_images(self):
+        with mock.patch('products.serializers.optimize_image') as optimize_image:
+            response = self.client.post(
+                reverse('baseproduct_create'),
+                self.payload(categories=[0], **{'images[0]imagen': png_upload()}),
+                format='multipart'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        optimize_image.assert_not_called()
+
+    def test_large_images_are_resized(self):
+        buffer = BytesIO()
+        PILImage.new('RGB', (3200, 800), 'blue').save(buffer, format='JPEG')
+        upload = SimpleUploadedFile('wide.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+        response = self.client.post(
+            reverse('baseproduct_create'), self.payload(**{'images[0]imagen': upload}), format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        image = Image.objects.get(base_product_id=response.json()['id'])
+        with PILImage.open(image.imagen) as stored:
+            self.assertEqual((stored.format, stored.size), ('WEBP', (1600, 400)))
+
+    def test_deactivated_category_is_rejected(self):
+        inactive = Category.objects.create(name='Workstation')
+        self.client.post(reverse('baseproduct_create'), self.payload(categories=[inactive.pk]), format='multipart')
+        Category.objects.filter(pk=inactive.pk).update(active=False)
+
+        response = self.client.post(
+            reverse('baseproduct_create'),
+            self.payload(model_name='Lenovo Legion 7', categories=[self.category.pk, inactive.pk]),
+            format='multipart'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(str(inactive.pk), response.json()['categories'][0])
+
+class PaginationTests(ProductAPITestCase):
+    """List endpoints return the limit/offset envelope."""
+
+    def test_product_list_envelope(self):
+        response = self.client.get(reverse('baseproduct_list'), {'limit': 1})
+
+        body = response.json()
+        self.assertEqual(body['count'], 1)
+        self.assertIsNone(body['next'])
+        self.assertEqual([row['id'] for row in body['results']], [self.product.pk])
+
+    def test_count_includes_new_products(self):
+        url = reverse('baseproduct_list')
+        self.client.get(url)
+
+        BaseProduct.objects.create(model_name='Lenovo Legion 5', long_description='Gaming laptop', brand=self.brand)
+
+        self.assertEqual(self.client.get(url).json()['count'], 2)
+
+
+class ConditionalGetTests(ProductAPITestCase):
+    """Validators cover the product, its brand and its categories, and are checked before rendering."""
+
+    def setUp(self):
+        super().setUp()
+        # Age the catalog, so writes made by a test land in a later second
+        self.past = timezone.now() - timedelta(days=1)
+        for model in (BaseProduct, Brand, Category):
+            model.objects.update(update_date=self.past)
+        self.detail_url = reverse('baseproduct_detail', args=[self.product.pk])
+        self.list_url = reverse('baseproduct_list')
+
+    def test_unchanged_detail_returns_304_without_rendering(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unchanged_list_returns_304(self):
+        etag = self.client.get(self.list_url)['ETag']
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_brand_rename_invalidates_list_and_detail(self):
+        urls = [self.list_url, self.detail_url]
+        dates = [self.client.get(url)['Last-Modified'] for url in urls]
+
+        self.client.patch(reverse('brand_update', args=[self.brand.pk]), {'name': 'Lenovo Legion'}, format='json')
+
+        for url, last_modified in zip(urls, dates):
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('Lenovo Legion', response.content.decode())
+
+    def test_category_toggle_invalidates_detail(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+
+        self.client.post(reverse('category_deactivate', args=[self.category.pk]))
+
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deleted_product_changes_list_etag(self):
+        other = BaseProduct.objects.create(model_name='Lenovo Legion 5', long_description='Gaming laptop', brand=self.brand)
+        BaseProduct.objects.filter(pk=other.pk).update(update_date=self.past)
+        etag = self.client.get(self.list_url)['ETag']
+
+        other.delete()
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 1)
+
+
+class BaseProductExportTests(ProductAPITestCase):
+    """The NDJSON export streams one full product per line."""
+
+    def test_streams_one_product_per_line(self):
+        BaseProduct.objects.create(model_name='Asus TUF A15', long_description='Gaming laptop', brand=self.brand)
+
+        response = self.client.get(reverse('baseproduct_export'), {'ordering': 'model_name'})
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row['model_name'] for row in rows], ['Asus TUF A15', 'Lenovo LOQ 15'])
+        self.assertEqual([category['id'] for category in rows[1]['categories']], [self.category.pk])
+        self.assertIn('specs', rows[0])
+
+    def test_applies_list_filters(self):
+        BaseProduct.objects.create(model_name='Asus TUF A15', long_description='Gaming laptop', brand=self.brand)
+
+        response = self.client.get(reverse('baseproduct_export'), {'model_name': 'loq'})
+
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [self.product.pk])
+
+
+class ProductVariantDiscountTests(ProductAPITestCase):
+    """effective_price and has_discount come from the active discount, if any."""
+
+    def setUp(self):
+        super().setUp()
+        self.plain, self.discounted, self.expired = ProductVariant.objects.bulk_create([
+            ProductVariant(base_product=self.product, price=price) for price in (1000, 2000, 3000)
+        ])
+        Discount.objects.create(product_variant=self.discounted, discount_price=1500)
+        Discount.objects.create(product_variant=self.expired, discount_price=2500, active=False)
+        self.expected = {
+            self.plain.pk: (1000, False),
+            self.discounted.pk: (1500, True),
+            self.expired.pk: (3000, False),
+        }
+
+    def test_list_annotates_discounts(self):
+        response = self.client.get(reverse('productvariant_list'))
+
+        self.assertEqual(
+            {row['id']: (row['effective_price'], row['has_discount']) for row in response.json()['results']},
+            self.expected
+        )
+
+    def test_detail_annotates_discount(self):
+        response = self.client.get(reverse('productvariant_detail', args=[self.discounted.pk]))
+
+        self.assertEqual((response.json()['effective_price'], response.json()['has_discount']), (1500, True))
+
+    def test_unannotated_instances_fall_back_to_the_discount_row(self):
+        for variant in (self.plain, self.discounted, self.expired):
+            data = ProductVariantSerializer(ProductVariant.objects.get(pk=variant.pk)).data
+            self.assertEqual((data['effective_price'], data['has_discount']), self.expected[variant.pk])
+
+
+class ProductVariantListTests(ProductAPITestCase):
+    """Variant listings summarize the base product."""
+
+    def test_rows_carry_a_base_product_summary(self):
+        ProductVariant.objects.create(base_product=self.product, price=1000)
+
+        response = self.client.get(reverse('productvariant_list'))
+
+        self.assertEqual(response.json()['results'][0]['base_product'], {
+            'id': self.product.pk,
+            'model_name': 'Lenovo LOQ 15',
+            'slug': self.product.slug,
+            'brand_name': 'Lenovo',
+        })
+
+    def test_page_is_read_with_a_single_select(self):
+        ProductVariant.objects.bulk_create([
+            ProductVariant(base_product=self.product, price=price) for price in (1000, 2000, 3000)
+        ])
+
+        # COUNT(*) plus the joined page, whatever the number of rows
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('productvariant_list'), {'ordering': '-price'})
+
+        self.assertEqual([row['price'] for row in response.json()['results']], [3000, 2000, 1000])
+
+
+class BaseProductLookupTests(ProductAPITestCase):
+    """The detail endpoint resolves IDs and slugs in one query, preferring the ID."""
+
+    def create_product(self, slug):
+        return BaseProduct.objects.create(
+            model_name=f'Lenovo {slug}', slug=slug, long_description='Gaming laptop', brand=self.brand
+        )
+
+    def get_detail(self, value):
+        with self.assertNumQueries(4):
+            return self.client.get(reverse('baseproduct_detail', args=[value]))
+
+    def test_lookup_by_slug(self):
+        response = self.get_detail(self.product.slug)
+
+        self.assertEqual(response.json()['id'], self.product.pk)
+
+    def test_id_wins_over_numeric_slug(self):
+        self.create_product(str(self.product.pk))
+
+        response = self.get_detail(str(self.product.pk))
+
+        self.assertEqual(response.json()['id'], self.product.pk)
+
+    def test_numeric_slug_without_matching_id(self):
+        numeric = self.create_product('999999')
+
+        response = self.get_detail('999999')
+
+        self.assertEqual(response.json()['id'], numeric.pk)
+
+    def test_unknown_value_returns_404(self):
+        response = self.client.get(reverse('baseproduct_detail', args=['no-such-laptop']))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -12,6 +12,7 @@ from .views import (
     CategoryDeactivateView,
     BaseProductListView,
     BaseProductDetailView,
+    BaseProductExportView,
     BaseProductCreateView,
     BaseProductUpdateView,
     BaseProductActivateView,
@@ -23,37 +24,89 @@ from .views import (
     ProductVariantActivateView,
     ProductVariantDeactivateView,
     ProductVariantPublishView,
-    ProductVariantUnpublishView
+    ProductVariantUnpublishView,
+    BrandBulkActivateView,
+    BrandBulkDeactivateView,
+    CategoryBulkActivateView,
+    CategoryBulkDeactivateView,
+    BaseProductBulkActivateView,
+    BaseProductBulkDeactivateView,
+    ProductVariantBulkActivateView,
+    ProductVariantBulkDeactivateView,
+    ProductVariantBulkPublishView,
+    ProductVariantBulkUnpublishView
 )
 
-urlpatterns = [
-    # Brand endpoints
-    path('brands/list/', BrandListView.as_view(), name='brand_list'),
-    path('brands/create/', BrandCreateView.as_view(), name='brand_create'),
-    path('brands/update/<int:pk>/', BrandUpdateView.as_view(), name='brand_update'),
-    path('brands/activate/<int:pk>/', BrandActivateView.as_view(), name='brand_activate'),
-    path('brands/deactivate/<int:pk>/', BrandDeactivateView.as_view(), name='brand_deactivate'),
 
-    # Category endpoints
-    path('categories/list/', CategoryListView.as_view(), name='category_list'),
-    path('categories/create/', CategoryCreateView.as_view(), name='category_create'),
-    path('categories/update/<int:pk>/', CategoryUpdateView.as_view(), name='category_update'),
-    path('categories/activate/<int:pk>/', CategoryActivateView.as_view(), name='category_activate'),
-    path('categories/deactivate/<int:pk>/', CategoryDeactivateView.as_view(), name='category_deactivate'),
+def crud_patterns(prefix, name, views, detail_converter='int'):
+    """
+    Builds the list/detail/create/update/activate/deactivate/publish routes (plus their
+    bulk variants) for one resource, so every model exposes the same URL layout
+    and names.
+    """
+    routes = [
+        ('list', 'list/'),
+        ('detail', f'detail/<{detail_converter}:pk>/'),
+        ('create', 'create/'),
+        ('update', 'update/<int:pk>/'),
+        ('activate', 'activate/<int:pk>/'),
+        ('deactivate', 'deactivate/<int:pk>/'),
+        ('publish', 'publish/<int:pk>/'),
+        ('unpublish', 'unpublish/<int:pk>/'),
+        ('bulk_activate', 'bulk-activate/'),
+        ('bulk_deactivate', 'bulk-deactivate/'),
+        ('bulk_publish', 'bulk-publish/'),
+        ('bulk_unpublish', 'bulk-unpublish/'),
+    ]
+    return [
+        path(f'{prefix}/{route}', views[action].as_view(), name=f'{name}_{action}')
+        for action, route in routes
+        if action in views
+    ]
 
-    # BaseProduct endpoints
-    path('base-products/list/', BaseProductListView.as_view(), name='baseproduct_list'),
-    path('base-products/detail/<str:pk>/', BaseProductDetailView.as_view(), name='baseproduct_detail'),
-    path('base-products/create/', BaseProductCreateView.as_view(), name='baseproduct_create'),
-    path('base-products/update/<int:pk>/', BaseProductUpdateView.as_view(), name='baseproduct_update'),
-    path('base-products/activate/<int:pk>/', BaseProductActivateView.as_view(), name='baseproduct_activate'),
-    path('base-products/deactivate/<int:pk>/', BaseProductDeactivateView.as_view(), name='baseproduct_deactivate'),
 
-    # ProductVariant endpoints
-    path('variants/list/', ProductVariantListView.as_view(), name='productvariant_list'),
-    path('variants/detail/<int:pk>/', ProductVariantDetailView.as_view(), name='productvariant_detail'),
-    path('variants/create/', ProductVariantCreateView.as_view(), name='productvariant_create'),
-    path('variants/update/<int:pk>/', ProductVariantUpdateView.as_view(), name='productvariant_update'),
-    path('variants/activate/<int:pk>/', ProductVariantActivateView.as_view(), name='productvariant_activate'),
-    path('variants/deactivate/<int:pk>/', ProductVariantDeactivateView.as_view(), name='productvariant_deactivate'),
+urlpatterns = [
+    *crud_patterns('brands', 'brand', {
+        'list': BrandListView,
+        'create': BrandCreateView,
+        'update': BrandUpdateView,
+        'activate': BrandActivateView,
+        'deactivate': BrandDeactivateView,
+        'bulk_activate': BrandBulkActivateView,
+        'bulk_deactivate': BrandBulkDeactivateView,
+    }),
+    *crud_patterns('categories', 'category', {
+        'list': CategoryListView,
+        'create': CategoryCreateView,
+        'update': CategoryUpdateView,
+        'activate': CategoryActivateView,
+        'deactivate': CategoryDeactivateView,
+        'bulk_activate': CategoryBulkActivateView,
+        'bulk_deactivate': CategoryBulkDeactivateView,
+    }),
+    *crud_patterns('base-products', 'baseproduct', {
+        'list': BaseProductListView,
+        'detail': BaseProductDetailView,
+        'create': BaseProductCreateView,
+        'update': BaseProductUpdateView,
+        'activate': BaseProductActivateView,
+        'deactivate': BaseProductDeactivateView,
+        'bulk_activate': BaseProductBulkActivateView,
+        'bulk_deactivate': BaseProductBulkDeactivateView,
+    }, detail_converter='str'),
+    path('base-products/export/', BaseProductExportView.as_view(), name='baseproduct_export'),
+    *crud_patterns('variants', 'productvariant', {
+        'list': ProductVariantListView,
+        'detail': ProductVariantDetailView,
+        'create': ProductVariantCreateView,
+        'update': ProductVariantUpdateView,
+        'activate': ProductVariantActivateView,
+        'deactivate': ProductVariantDeactivateView,
+        'publish': ProductVariantPublishView,
+        'unpublish': ProductVariantUnpublishView,
+        'bulk_activate': ProductVariantBulkActivateView,
+        'bulk_deactivate': ProductVariantBulkDeactivateView,
+        'bulk_publish': ProductVariantBulkPublishView,
+        'bulk_unpublish': ProductVariantBulkUnpublishView,
+    }),
 ]
@@ -0,0 +1,67 @@
+import re
+import uuid
+from io import BytesIO
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.utils.text import slugify
+from django.utils.translation import gettext as _
+from PIL import Image as PILImage, ImageOps, UnidentifiedImageError
+
+IMAGE_MAX_UPLOAD_SIZE = 5 * 1024 * 1024
+IMAGE_MAX_DIMENSIONS = (1600, 1600)
+IMAGE_WEBP_QUALITY = 82
+
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_HYPHENATE_RE = re.compile(r'[-\s]+')
+
+
+def fast_slugify(value):
+    """
+    Same output as django.utils.text.slugify, skipping the unicode
+    normalization for ASCII input, which is the common case.
+    """
+    value = str(value)
+    if not value.isascii():
+        return slugify(value)
+    value = _SLUG_STRIP_RE.sub('', value.lower())
+    return _SLUG_HYPHENATE_RE.sub('-', value).strip('-_')
+
+
+def validate_image_max_size(value):
+    """Rejects uploaded images bigger than IMAGE_MAX_UPLOAD_SIZE."""
+    if value.size > IMAGE_MAX_UPLOAD_SIZE:
+        raise ValidationError(
+            f"Image size must be at most {IMAGE_MAX_UPLOAD_SIZE // (1024 * 1024)} MB."
+        )
+
+
+def decode_image(uploaded_file):
+    """
+    Decodes the uploaded image, resized to fit IMAGE_MAX_DIMENSIONS.
+    Returns the loaded PIL image, ready for optimize_image.
+    Raises ValidationError if the file can't be decoded as an image.
+    """
+    uploaded_file.seek(0)
+    try:
+        with PILImage.open(uploaded_file) as img:
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail(IMAGE_MAX_DIMENSIONS)
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+            img.load()
+    except (UnidentifiedImageError, OSError, PILImage.DecompressionBombError):
+        raise ValidationError(
+            _("Upload a valid image. The file you uploaded was either not an image or a corrupted image."),
+            code='invalid_image'
+        )
+    return img
+
+
+def optimize_image(img):
+    """
+    Re-encodes an image returned by decode_image as WEBP.
+    Returns a ContentFile ready to be assigned to an ImageField.
+    """
+    buffer = BytesIO()
+    img.save(buffer, format='WEBP', quality=IMAGE_WEBP_QUALITY)
+    return ContentFile(buffer.getvalue(), name=f"{uuid.uuid4()}.webp")
@@ -1,13 +1,17 @@
+import hashlib
+from datetime import datetime
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.generics import ListAPIView, CreateAPIView, UpdateAPIView, RetrieveAPIView
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.shortcuts import get_object_or_404
-from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
+from django.db.models import BooleanField, Count, ExpressionWrapper, Max, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from .models import Brand, Category, BaseProduct, ProductVariant
 from .serializers import (
     BrandSerializer,
@@ -17,13 +21,28 @@ from .serializers import (
     CategoryCreateSerializer,
     CategoryUpdateSerializer,
     BaseProductSerializer,
+    BaseProductListSerializer,
     BaseProductCreateSerializer,
     BaseProductUpdateSerializer,
     ProductVariantSerializer,
+    ProductVariantListSerializer,
     ProductVariantCreateSerializer,
-    ProductVariantUpdateSerializer
+    ProductVariantUpdateSerializer,
+    BulkIdsSerializer
 )
 from .filters import BaseProductFilter, ProductVariantFilter
+from .cache import (
+    BRAND_LIST_KEY,
+    CATEGORY_LIST_KEY,
+    get_cached_list,
+    invalidate_brand_caches,
+    invalidate_category_caches
+)
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from core.mixins import EagerLoadingMixin
+from core.views import FlagToggleView, flag_changes
+from core.pagination import StandardResultsSetPagination
 
 
 class BrandListView(ListAPIView):
@@ -31,12 +50,19 @@ class BrandListView(ListAPIView):
     View to list all brands.
 
     GET: Returns a list of all brands with their information.
+    The serialized list is cached and dropped whenever a brand changes.
     Requires JWT authentication via Bearer token.
     """
     queryset = Brand.objects.all()
     serializer_class = BrandSerializer
     permission_classes = [IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        return Response(get_cached_list(
+            BRAND_LIST_KEY,
+            lambda: self.get_serializer(self.get_queryset(), many=True).data
+        ))
+
 
 class BrandCreateView(CreateAPIView):
     """
@@ -84,56 +110,40 @@ class BrandUpdateView(UpdateAPIView):
         }, status=status.HTTP_200_OK)
 
 
-class BrandActivateView(APIView):
+class BrandActivateView(FlagToggleView):
     """
     View to activate a brand.
 
     POST: Sets active=True for the specified brand.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        brand = get_object_or_404(Brand, pk=pk)
-
-        if brand.active:
-            return Response({
-                'message': 'Brand is already active'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        brand.active = True
-        brand.save()
+    model = Brand
+    value = True
+    serializer_class = BrandSerializer
+    response_key = 'brand'
+    message = 'Brand activated successfully'
+    already_message = 'Brand is already active'
 
-        return Response({
-            'message': 'Brand activated successfully',
-            'brand': BrandSerializer(brand).data
-        }, status=status.HTTP_200_OK)
+    def after_update(self):
+        invalidate_brand_caches()
 
 
-class BrandDeactivateView(APIView):
+class BrandDeactivateView(FlagToggleView):
     """
     View to deactivate a brand.
 
     POST: Sets active=False for the specified brand.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        brand = get_object_or_404(Brand, pk=pk)
-
-        if not brand.active:
-            return Response({
-                'message': 'Brand is already inactive'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        brand.active = False
-        brand.save()
+    model = Brand
+    value = False
+    serializer_class = BrandSerializer
+    response_key = 'brand'
+    message = 'Brand deactivated successfully'
+    already_message = 'Brand is already inactive'
 
-        return Response({
-            'message': 'Brand deactivated successfully',
-            'brand': BrandSerializer(brand).data
-        }, status=status.HTTP_200_OK)
+    def after_update(self):
+        invalidate_brand_caches()
 
 
 # Category Views
@@ -143,12 +153,19 @@ class CategoryListView(ListAPIView):
     View to list all categories.
 
     GET: Returns a list of all categories with their information.
+    The serialized list is cached and dropped whenever a category changes.
     Requires JWT authentication via Bearer token.
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        return Response(get_cached_list(
+            CATEGORY_LIST_KEY,
+            lambda: self.get_serializer(self.get_queryset(), many=True).data
+        ))
+
 
 class CategoryCreateView(CreateAPIView):
     """
@@ -196,65 +213,123 @@ class CategoryUpdateView(UpdateAPIView):
         }, status=status.HTTP_200_OK)
 
 
-class CategoryActivateView(APIView):
+class CategoryActivateView(FlagToggleView):
     """
     View to activate a category.
 
     POST: Sets active=True for the specified category.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        category = get_object_or_404(Category, pk=pk)
-
-        if category.active:
-            return Response({
-                'message': 'Category is already active'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        category.active = True
-        category.save()
+    model = Category
+    value = True
+    serializer_class = CategorySerializer
+    response_key = 'category'
+    message = 'Category activated successfully'
+    already_message = 'Category is already active'
 
-        return Response({
-            'message': 'Category activated successfully',
-            'category': CategorySerializer(category).data
-        }, status=status.HTTP_200_OK)
+    def after_update(self):
+        invalidate_category_caches()
 
 
-class CategoryDeactivateView(APIView):
+class CategoryDeactivateView(FlagToggleView):
     """
     View to deactivate a category.
 
     POST: Sets active=False for the specified category.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
+    model = Category
+    value = False
+    serializer_class = CategorySerializer
+    response_key = 'category'
+    message = 'Category deactivated successfully'
+    already_message = 'Category is already inactive'
 
-    def post(self, request, pk):
-        category = get_object_or_404(Category, pk=pk)
+    def after_update(self):
+        invalidate_category_caches()
 
-        if not category.active:
-            return Response({
-                'message': 'Category is already inactive'
-            }, status=status.HTTP_400_BAD_REQUEST)
 
-        category.active = False
-        category.save()
+# BaseProduct Views
 
-        return Response({
-            'message': 'Category deactivated successfully',
-            'category': CategorySerializer(category).data
-        }, status=status.HTTP_200_OK)
+def wants_full_echo(request):
+    """True when a write request asks for the saved object in the response (?echo=full)."""
+    return request.query_params.get('echo') == 'full'
 
 
-# BaseProduct Views
+def filter_base_product_lookup(queryset, value):
+    """
+    Narrows queryset to the product whose slug is value or, for numeric values,
+    whose ID is value, in a single query. An ID match wins over a numeric slug.
+    """
+    if not value.isdigit():
+        return queryset.filter(slug=value)
+    id_match = ExpressionWrapper(Q(pk=value), output_field=BooleanField())
+    return queryset.filter(Q(pk=value) | Q(slug=value)).order_by(id_match.desc())
+
+
+def conditional_validators(get_state):
+    """
+    Builds the etag and last_modified functions for condition() from
+    get_state(request, *args, **kwargs), which returns a tuple of
+    update_dates and row counts, or None when there is nothing to serve.
+
+    Last-Modified is the newest of those dates. The ETag covers every value
+    at full precision, so it also changes for deletions and for writes in
+    the same second as a fetch, which Last-Modified can't express.
+    The state is read once per request, before the view renders anything.
+    """
+    def read_state(request, *args, **kwargs):
+        if not hasattr(request, 'conditional_state'):
+            request.conditional_state = get_state(request, *args, **kwargs)
+        return request.conditional_state
+
+    def etag(request, *args, **kwargs):
+        state = read_state(request, *args, **kwargs)
+        if state is None:
+            return None
+        return hashlib.sha1(repr(state).encode()).hexdigest()
+
+    def last_modified(request, *args, **kwargs):
+        state = read_state(request, *args, **kwargs)
+        if state is None:
+            return None
+        return max((value for value in state if isinstance(value, datetime)), default=None)
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
+
 
-class BaseProductListView(ListAPIView):
+def base_product_list_state(request, *args, **kwargs):
+    """
+    Newest update_date and row count of products, brands and categories.
+    Any change to the catalog, whatever the filters, invalidates every list page.
+    """
+    state = ()
+    for model in (BaseProduct, Brand, Category):
+        row = model.objects.aggregate(latest=Max('update_date'), count=Count('pk'))
+        state += (row['latest'], row['count'])
+    return state
+
+
+def base_product_detail_state(request, pk, *args, **kwargs):
+    """
+    update_date of the product (by ID or slug), of its brand and the newest
+    of its categories, plus its category count. None when it does not exist.
+    """
+    return filter_base_product_lookup(BaseProduct.objects.all(), pk).annotate(
+        categories_update_date=Max('categories__update_date'),
+        category_count=Count('categories')
+    ).values_list('update_date', 'brand__update_date', 'categories_update_date', 'category_count').first()
+
+
+@method_decorator(conditional_validators(base_product_list_state), name='get')
+class BaseProductListView(EagerLoadingMixin, ListAPIView):
     """
     View to list and filter BaseProducts.
 
     GET: Returns a list of products with advanced filtering capabilities.
+    Categories are returned by name and only the first image URL is
+    included (primary_image); specs and long_description are omitted.
+    Use the detail endpoint for the full representation.
     Requires JWT authentication via Bearer token.
 
     Available filters (via query parameters):
@@ -267,7 +342,7 @@ class BaseProductListView(ListAPIView):
     - ?categories=1 (category ID, can use multiple times)
     - ?active=true
 
-    Specs filters (JSON field filtering):
+    Specs filters (read the spec columns copied from specs on save):
     - ?spec_processor_model=i5 (processor model)
     - ?spec_processor_cores=10 (exact cores count)
     - ?spec_screen_size=15.6 (screen size)
@@ -281,6 +356,7 @@ class BaseProductListView(ListAPIView):
     - ?spec_storage_type=ssd (storage type)
     - ?spec_weight=2.4 (weight)
     - ?spec_battery=60wh (battery)
+    - ?spec=connectivity:wifi 6 (any spec, dotted key path and partial value)
 
     Search (searches in model_name and long_description):
     - ?search=gaming laptop
@@ -290,12 +366,22 @@ class BaseProductListView(ListAPIView):
     - ?ordering=-creation_date (descending by creation date)
     - Available fields: model_name, creation_date, update_date
 
+    Pagination:
+    - ?limit=25&offset=50 (default limit 25, maximum 100)
+    - The response is {"count", "next", "previous", "results"}
+
+    Responses carry ETag and Last-Modified headers, taken from the products,
+    brands and categories tables before the page is built. Send them back in
+    If-None-Match or If-Modified-Since to get a 304 Not Modified when nothing
+    in the catalog changed.
+
     Example:
     /products/base-products/?brand__name=lenovo&spec_memory_size=16gb&spec_processor_model=i5&ordering=-creation_date
     """
-    queryset = BaseProduct.objects.all().select_related('brand').prefetch_related('categories', 'images')
-    serializer_class = BaseProductSerializer
+    queryset = BaseProduct.objects.all()
+    serializer_class = BaseProductListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = BaseProductFilter
     search_fields = ['model_name', 'long_description']
@@ -303,7 +389,38 @@ class BaseProductListView(ListAPIView):
     ordering = ['-creation_date']
 
 
-class BaseProductDetailView(RetrieveAPIView):
+class BaseProductExportView(BaseProductListView):
+    """
+    View to export BaseProducts as newline-delimited JSON.
+
+    GET: Streams the full representation of every matching product, one
+    JSON object per line. Products are read in chunks, so memory use does
+    not grow with the size of the catalog.
+    Accepts the same filters, search and ordering as the list endpoint.
+    Requires JWT authentication via Bearer token.
+
+    Example:
+    /products/base-products/export/?brand__name=lenovo&active=true
+    """
+    serializer_class = BaseProductSerializer
+    pagination_class = None
+    chunk_size = 500
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        renderer = ORJSONRenderer()
+
+        def rows():
+            # iterator() prefetches categories and images per chunk
+            for product in queryset.iterator(chunk_size=self.chunk_size):
+                yield renderer.render(serializer.to_representation(product)) + b'\n'
+
+        return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+
+
+@method_decorator(conditional_validators(base_product_detail_state), name='get')
+class BaseProductDetailView(EagerLoadingMixin, RetrieveAPIView):
     """
     View to retrieve a single BaseProduct by ID or slug.
 
@@ -315,11 +432,14 @@ class BaseProductDetailView(RetrieveAPIView):
 
     Requires JWT authentication via Bearer token.
 
+    Supports If-None-Match and If-Modified-Since through the update_date of
+    the product, its brand and its categories.
+
     You can retrieve by:
     - ID: /products/base-products/1/
     - Slug: /products/base-products/lenovo-loq-156/
     """
-    queryset = BaseProduct.objects.all().select_related('brand').prefetch_related('categories', 'images')
+    queryset = BaseProduct.objects.all()
     serializer_class = BaseProductSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
@@ -327,16 +447,14 @@ class BaseProductDetailView(RetrieveAPIView):
     def get_object(self):
         """
         Override to allow lookup by both pk and slug.
-        First tries pk, then falls back to slug if pk is not a number.
+        Numeric values match the ID or a numeric slug, preferring the ID.
         """
         lookup_value = self.kwargs.get(self.lookup_field)
-
-        # Try to get by pk first (if it's a number)
-        if lookup_value.isdigit():
-            return get_object_or_404(self.queryset, pk=lookup_value)
-
-        # Otherwise, try to get by slug
-        return get_object_or_404(self.queryset, slug=lookup_value)
+        product = filter_base_product_lookup(self.get_queryset(), lookup_value).first()
+        if product is None:
+            raise Http404
+        self.check_object_permissions(self.request, product)
+        return product
 
 
 class BaseProductCreateView(CreateAPIView):
@@ -344,6 +462,7 @@ class BaseProductCreateView(CreateAPIView):
     View to create a new BaseProduct with images.
 
     POST: Creates a new product with up to 4 images and flexible specs JSON.
+    Responds with the new product's id; add ?echo=full to get the full product back.
     Requires JWT authentication via Bearer token.
     Accepts multipart/form-data for image uploads.
 
@@ -353,8 +472,8 @@ class BaseProductCreateView(CreateAPIView):
     - brand: Brand ID
     - categories: List of category IDs (e.g., [1, 2])
     - specs: JSON object with product specifications (flexible structure)
-    - image_1, image_2, image_3, image_4: Image files (optional)
-    - alt_text_1, alt_text_2, alt_text_3, alt_text_4: Alt text for images (optional)
+    - images[N]imagen: Image file, N from 0 to 3 (optional)
+    - images[N]alt_text: Alt text for image N (optional)
 
     Example specs for a laptop:
     {
@@ -370,14 +489,22 @@ class BaseProductCreateView(CreateAPIView):
     """
     serializer_class = BaseProductCreateSerializer
     permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
 
-    @transaction.atomic
-    def create(self, request, *args, **kwargs):        
+    def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         base_product = serializer.save()
 
+        if not wants_full_echo(request):
+            return Response({
+                'message': 'Product created successfully',
+                'id': base_product.pk
+            }, status=status.HTTP_201_CREATED)
+
+        # Re-read with the relations the response nests, instead of loading them one by one
+        base_product = BaseProductSerializer.setup_eager_loading(BaseProduct.objects.all()).get(pk=base_product.pk)
+
         return Response({
             'message': 'Product created successfully',
             'product': BaseProductSerializer(base_product).data
@@ -389,19 +516,20 @@ class BaseProductUpdateView(UpdateAPIView):
     View to update BaseProduct information.
 
     PATCH/PUT: Updates product information, specs, categories, and images.
+    Responds with the product's id; add ?echo=full to get the full product back.
     Requires JWT authentication via Bearer token.
     Accepts multipart/form-data for image uploads.
 
     All fields are optional for partial updates.
+    Use 'images[N]imagen' / 'images[N]alt_text' to add up to 4 new images.
     Use 'remove_images' with a list of image IDs to delete existing images.
     """
     queryset = BaseProduct.objects.all()
     serializer_class = BaseProductUpdateSerializer
     permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
     lookup_field = 'pk'
 
-    @transaction.atomic
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -410,71 +538,60 @@ class BaseProductUpdateView(UpdateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
+        if not wants_full_echo(request):
+            return Response({
+                'message': 'Product updated successfully',
+                'id': instance.pk
+            }, status=status.HTTP_200_OK)
+
+        # Re-read with the relations the response nests, instead of loading them one by one
+        instance = BaseProductSerializer.setup_eager_loading(BaseProduct.objects.all()).get(pk=instance.pk)
+
         return Response({
             'message': 'Product updated successfully',
             'product': BaseProductSerializer(instance).data
         }, status=status.HTTP_200_OK)
 
 
-class BaseProductActivateView(APIView):
+class BaseProductActivateView(FlagToggleView):
     """
     View to activate a BaseProduct.
 
     POST: Sets active=True for the specified product.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        product = get_object_or_404(BaseProduct, pk=pk)
-
-        if product.active:
-            return Response({
-                'message': 'Product is already active'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        product.active = True
-        product.save()
-
-        return Response({
-            'message': 'Product activated successfully',
-            'product': BaseProductSerializer(product).data
-        }, status=status.HTTP_200_OK)
+    model = BaseProduct
+    value = True
+    serializer_class = BaseProductSerializer
+    response_key = 'product'
+    message = 'Product activated successfully'
+    already_message = 'Product is already active'
 
 
-class BaseProductDeactivateView(APIView):
+class BaseProductDeactivateView(FlagToggleView):
     """
     View to deactivate a BaseProduct.
 
     POST: Sets active=False for the specified product.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        product = get_object_or_404(BaseProduct, pk=pk)
-
-        if not product.active:
-            return Response({
-                'message': 'Product is already inactive'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        product.active = False
-        product.save()
-
-        return Response({
-            'message': 'Product deactivated successfully',
-            'product': BaseProductSerializer(product).data
-        }, status=status.HTTP_200_OK)
+    model = BaseProduct
+    value = False
+    serializer_class = BaseProductSerializer
+    response_key = 'product'
+    message = 'Product deactivated successfully'
+    already_message = 'Product is already inactive'
 
 
 # ProductVariant Views
 
-class ProductVariantListView(ListAPIView):
+class ProductVariantListView(EagerLoadingMixin, ListAPIView):
     """
     View to list and filter ProductVariants.
 
     GET: Returns a list of product variants with advanced filtering capabilities.
+    Each variant carries a summary of its base product (id, model_name, slug,
+    brand_name); use the detail endpoint for the full base product.
     Requires JWT authentication via Bearer token.
 
     Available filters (via query parameters):
@@ -493,19 +610,24 @@ class ProductVariantListView(ListAPIView):
     - ?ordering=-price (descending by price)
     - Available fields: price, creation_date, update_date
 
+    Pagination:
+    - ?limit=25&offset=50 (default limit 25, maximum 100)
+    - The response is {"count", "next", "previous", "results"}
+
     Example:
     /products/variants/?base_product=1&condition=nuevo&price_min=1000000&price_max=2000000&ordering=price
     """
-    queryset = ProductVariant.objects.all().select_related('base_product__brand').prefetch_related('base_product__categories', 'base_product__images')
-    serializer_class = ProductVariantSerializer
+    queryset = ProductVariant.objects.all()
+    serializer_class = ProductVariantListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ProductVariantFilter
     ordering_fields = ['price', 'creation_date', 'update_date']
     ordering = ['price']
 
 
-class ProductVariantDetailView(RetrieveAPIView):
+class ProductVariantDetailView(EagerLoadingMixin, RetrieveAPIView):
     """
     View to retrieve a single ProductVariant by ID.
 
@@ -515,7 +637,7 @@ class ProductVariantDetailView(RetrieveAPIView):
 
     Requires JWT authentication via Bearer token.
     """
-    queryset = ProductVariant.objects.all().select_related('base_product__brand').prefetch_related('base_product__categories', 'base_product__images')
+    queryset = ProductVariant.objects.all()
     serializer_class = ProductVariantSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
@@ -526,6 +648,7 @@ class ProductVariantCreateView(CreateAPIView):
     View to create a new ProductVariant.
 
     POST: Creates a new product variant with the provided data.
+    Responds with the new variant's id; add ?echo=full to get the full variant back.
     Requires JWT authentication via Bearer token.
 
     Expected fields:
@@ -547,12 +670,20 @@ class ProductVariantCreateView(CreateAPIView):
     serializer_class = ProductVariantCreateSerializer
     permission_classes = [IsAuthenticated]
 
-    @transaction.atomic
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         product_variant = serializer.save()
 
+        if not wants_full_echo(request):
+            return Response({
+                'message': 'Product variant created successfully',
+                'id': product_variant.pk
+            }, status=status.HTTP_201_CREATED)
+
+        # Re-read with the relations and discount the response nests, instead of loading them one by one
+        product_variant = ProductVariantSerializer.setup_eager_loading(ProductVariant.objects.all()).get(pk=product_variant.pk)
+
         return Response({
             'message': 'Product variant created successfully',
             'product_variant': ProductVariantSerializer(product_variant).data
@@ -564,6 +695,7 @@ class ProductVariantUpdateView(UpdateAPIView):
     View to update ProductVariant information.
 
     PATCH/PUT: Updates product variant information.
+    Responds with the variant's id; add ?echo=full to get the full variant back.
     Requires JWT authentication via Bearer token.
 
     All fields are optional for partial updates:
@@ -578,7 +710,6 @@ class ProductVariantUpdateView(UpdateAPIView):
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
 
-    @transaction.atomic
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -586,111 +717,237 @@ class ProductVariantUpdateView(UpdateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
+        if not wants_full_echo(request):
+            return Response({
+                'message': 'Product variant updated successfully',
+                'id': instance.pk
+            }, status=status.HTTP_200_OK)
+
+        # Re-read with the relations and discount the response nests, instead of loading them one by one
+        instance = ProductVariantSerializer.setup_eager_loading(ProductVariant.objects.all()).get(pk=instance.pk)
+
         return Response({
             'message': 'Product variant updated successfully',
             'product_variant': ProductVariantSerializer(instance).data
         }, status=status.HTTP_200_OK)
 
 
-class ProductVariantActivateView(APIView):
+class ProductVariantActivateView(FlagToggleView):
     """
     View to activate a ProductVariant.
 
     POST: Sets active=True for the specified product variant.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        variant = get_object_or_404(ProductVariant, pk=pk)
+    model = ProductVariant
+    value = True
+    serializer_class = ProductVariantSerializer
+    response_key = 'product_variant'
+    message = 'Product variant activated successfully'
+    already_message = 'Product variant is already active'
 
-        if variant.active:
-            return Response({
-                'message': 'Product variant is already active'
-            }, status=status.HTTP_400_BAD_REQUEST)
 
-        variant.active = True
-        variant.save()
+class ProductVariantDeactivateView(FlagToggleView):
+    """
+    View to deactivate a ProductVariant.
 
-        return Response({
-            'message': 'Product variant activated successfully',
-            'product_variant': ProductVariantSerializer(variant).data
-        }, status=status.HTTP_200_OK)
+    POST: Sets active=False for the specified product variant.
+    Requires JWT authentication via Bearer token.
+    """
+    model = ProductVariant
+    value = False
+    serializer_class = ProductVariantSerializer
+    response_key = 'product_variant'
+    message = 'Product variant deactivated successfully'
+    already_message = 'Product variant is already inactive'
 
 
-class ProductVariantDeactivateView(APIView):
+class ProductVariantPublishView(FlagToggleView):
     """
-    View to deactivate a ProductVariant.
+    View to publish a ProductVariant (make it visible in the store).
 
-    POST: Sets active=False for the specified product variant.
+    POST: Sets is_published=True for the specified product variant.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
+    model = ProductVariant
+    field = 'is_published'
+    value = True
+    serializer_class = ProductVariantSerializer
+    response_key = 'product_variant'
+    message = 'Product variant published successfully'
+    already_message = 'Product variant is already published'
 
-    def post(self, request, pk):
-        variant = get_object_or_404(ProductVariant, pk=pk)
 
-        if not variant.active:
-            return Response({
-                'message': 'Product variant is already inactive'
-            }, status=status.HTTP_400_BAD_REQUEST)
+class ProductVariantUnpublishView(FlagToggleView):
+    """
+    View to unpublish a ProductVariant (hide it from the store).
 
-        variant.active = False
-        variant.save()
+    POST: Sets is_published=False for the specified product variant.
+    Requires JWT authentication via Bearer token.
+    """
+    model = ProductVariant
+    field = 'is_published'
+    value = False
+    serializer_class = ProductVariantSerializer
+    response_key = 'product_variant'
+    message = 'Product variant unpublished successfully'
+    already_message = 'Product variant is already unpublished'
 
-        return Response({
-            'message': 'Product variant deactivated successfully',
-            'product_variant': ProductVariantSerializer(variant).data
-        }, status=status.HTTP_200_OK)
 
+# Bulk toggle Views
 
-class ProductVariantPublishView(APIView):
+class BulkToggleView(APIView):
     """
-    View to publish a ProductVariant (make it visible in the store).
+    Base view that sets a boolean flag on many rows with a single UPDATE.
 
-    POST: Sets is_published=True for the specified product variant.
+    POST: Expects {"ids": [1, 2, 3]}. Rows already in the target state and
+    unknown IDs are skipped; the response reports how many rows changed.
     Requires JWT authentication via Bearer token.
     """
     permission_classes = [IsAuthenticated]
+    model = None
+    field = 'active'
+    value = True
+    message = ''
 
-    def post(self, request, pk):
-        variant = get_object_or_404(ProductVariant, pk=pk)
+    def after_update(self):
+        """Hook for work that .update() skips, such as signal-driven cache invalidation."""
 
-        if variant.is_published:
-            return Response({
-                'message': 'Product variant is already published'
-            }, status=status.HTTP_400_BAD_REQUEST)
+    def post(self, request):
+        serializer = BulkIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        variant.is_published = True
-        variant.save()
+        updated = self.model.objects.filter(
+            pk__in=serializer.validated_data['ids']
+        ).exclude(**{self.field: self.value}).update(**flag_changes(self.model, self.field, self.value))
+        if updated:
+            self.after_update()
 
         return Response({
-            'message': 'Product variant published successfully',
-            'product_variant': ProductVariantSerializer(variant).data
+            'message': self.message,
+            'updated': updated
         }, status=status.HTTP_200_OK)
 
 
-class ProductVariantUnpublishView(APIView):
+class BrandBulkActivateView(BulkToggleView):
     """
-    View to unpublish a ProductVariant (hide it from the store).
+    View to activate many brands at once.
 
-    POST: Sets is_published=False for the specified product variant.
-    Requires JWT authentication via Bearer token.
+    POST: Sets active=True for every brand in "ids".
     """
-    permission_classes = [IsAuthenticated]
+    model = Brand
+    value = True
+    message = 'Brands activated successfully'
 
-    def post(self, request, pk):
-        variant = get_object_or_404(ProductVariant, pk=pk)
+    def after_update(self):
+        invalidate_brand_caches()
 
-        if not variant.is_published:
-            return Response({
-                'message': 'Product variant is already unpublished'
-            }, status=status.HTTP_400_BAD_REQUEST)
 
-        variant.is_published = False
-        variant.save()
+class BrandBulkDeactivateView(BulkToggleView):
+    """
+    View to deactivate many brands at once.
 
-        return Response({
-            'message': 'Product variant unpublished successfully',
-            'product_variant': ProductVariantSerializer(variant).data
-        }, status=status.HTTP_200_OK)
+    POST: Sets active=False for every brand in "ids".
+    """
+    model = Brand
+    value = False
+    message = 'Brands deactivated successfully'
+
+    def after_update(self):
+        invalidate_brand_caches()
+
+
+class CategoryBulkActivateView(BulkToggleView):
+    """
+    View to activate many categories at once.
+
+    POST: Sets active=True for every category in "ids".
+    """
+    model = Category
+    value = True
+    message = 'Categories activated successfully'
+
+    def after_update(self):
+        invalidate_category_caches()
+
+
+class CategoryBulkDeactivateView(BulkToggleView):
+    """
+    View to deactivate many categories at once.
+
+    POST: Sets active=False for every category in "ids".
+    """
+    model = Category
+    value = False
+    message = 'Categories deactivated successfully'
+
+    def after_update(self):
+        invalidate_category_caches()
+
+
+class BaseProductBulkActivateView(BulkToggleView):
+    """
+    View to activate many BaseProducts at once.
+
+    POST: Sets active=True for every product in "ids".
+    """
+    model = BaseProduct
+    value = True
+    message = 'Products activated successfully'
+
+
+class BaseProductBulkDeactivateView(BulkToggleView):
+    """
+    View to deactivate many BaseProducts at once.
+
+    POST: Sets active=False for every product in "ids".
+    """
+    model = BaseProduct
+    value = False
+    message = 'Products deactivated successfully'
+
+
+class ProductVariantBulkActivateView(BulkToggleView):
+    """
+    View to activate many ProductVariants at once.
+
+    POST: Sets active=True for every product variant in "ids".
+    """
+    model = ProductVariant
+    value = True
+    message = 'Product variants activated successfully'
+
+
+class ProductVariantBulkDeactivateView(BulkToggleView):
+    """
+    View to deactivate many ProductVariants at once.
+
+    POST: Sets active=False for every product variant in "ids".
+    """
+    model = ProductVariant
+    value = False
+    message = 'Product variants deactivated successfully'
+
+
+class ProductVariantBulkPublishView(BulkToggleView):
+    """
+    View to publish many ProductVariants at once.
+
+    POST: Sets is_published=True for every product variant in "ids".
+    """
+    model = ProductVariant
+    field = 'is_published'
+    value = True
+    message = 'Product variants published successfully'
+
+
+class ProductVariantBulkUnpublishView(BulkToggleView):
+    """
+    View to unpublish many ProductVariants at once.
+
+    POST: Sets is_published=False for every product variant in "ids".
+    """
+    model = ProductVariant
+    field = 'is_published'
+    value = False
+    message = 'Product variants unpublished successfully'
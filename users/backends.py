@@ -0,0 +1,28 @@
+from django.contrib.auth.backends import ModelBackend
+from .models import User
+
+# Columns the login flow reads: credentials, the active flag and what LoginView returns
+LOGIN_FIELDS = ('id', 'email', 'password', 'is_active', 'first_name', 'last_name')
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authentication backend that looks the user up by email,
+    loading only the columns the login flow needs.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        email = username or kwargs.get(User.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
+
+        try:
+            user = User.objects.only(*LOGIN_FIELDS).get(email=email)
+        except User.DoesNotExist:
+            # Run the password hasher anyway, so response time doesn't reveal unknown emails
+            User().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,53 @@
+import hashlib
+from django.core.cache import cache
+
+# Counted in the configured cache, which must be shared between workers
+# (REDIS_URL) for the limits to hold; see CACHES in config/settings.py.
+LOGIN_FAILURES_KEY = 'users:login_failures:{}'
+LOGIN_FAILURE_TIMEOUT = 300
+# Failed logins allowed per account from one client, and per account overall.
+# The account cap bounds the password hashing spent on one targeted account
+# however many addresses the attempts come from.
+LOGIN_FAILURE_LIMIT = 5
+LOGIN_ACCOUNT_FAILURE_LIMIT = 20
+
+
+def login_failures_keys(email, client_ip):
+    """
+    Returns the cache keys counting failed logins for email overall and for
+    email from client_ip, hashed to keep them key-safe.
+    """
+    email = email.lower()
+    return {
+        LOGIN_FAILURES_KEY.format(hashlib.sha1(ident.encode()).hexdigest()): limit
+        for ident, limit in (
+            (email, LOGIN_ACCOUNT_FAILURE_LIMIT),
+            (f'{email}|{client_ip}', LOGIN_FAILURE_LIMIT),
+        )
+    }
+
+
+def is_login_locked(email, client_ip):
+    """
+    Returns True once email has LOGIN_FAILURE_LIMIT recent failed logins from
+    client_ip, or LOGIN_ACCOUNT_FAILURE_LIMIT from all clients together.
+    """
+    limits = login_failures_keys(email, client_ip)
+    counts = cache.get_many(limits)
+    return any(counts.get(key, 0) >= limit for key, limit in limits.items())
+
+
+def record_login_failure(email, client_ip):
+    """Counts a failed login; each count expires LOGIN_FAILURE_TIMEOUT after its first failure."""
+    for key in login_failures_keys(email, client_ip):
+        cache.add(key, 0, LOGIN_FAILURE_TIMEOUT)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr()
+            cache.set(key, 1, LOGIN_FAILURE_TIMEOUT)
+
+
+def clear_login_failures(email, client_ip):
+    """Resets the failed login counts after a successful login."""
+    cache.delete_many(list(login_failures_keys(email, client_ip)))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-creation_date', '-id'], name='user_creation_date_idx'),
+        ),
+    ]
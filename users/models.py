@@ -74,6 +74,10 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name = 'user'
         verbose_name_plural = 'users'
         ordering = ['-creation_date']
+        indexes = [
+            # Serves the paginated user list (newest first, id tie-breaker)
+            models.Index(fields=['-creation_date', '-id'], name='user_creation_date_idx'),
+        ]
 
     def __str__(self):
         return self.email
@@ -1,12 +1,21 @@
 from rest_framework import serializers
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import BaseThrottle
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User
+from .cache import LOGIN_FAILURE_TIMEOUT, clear_login_failures, is_login_locked, record_login_failure
+
+DUPLICATE_EMAIL_MESSAGE = 'A user with this email already exists.'
 
 
 class LoginSerializer(serializers.Serializer):
     """
     Serializer that handles user login and JWT token generation.
+    After repeated failed logins for an email, from one client or from all
+    clients together, further attempts are refused with 429 before the
+    password hasher runs.
     """
     email = serializers.CharField(required=True)
     password = serializers.CharField(required=True, write_only=True)
@@ -16,10 +25,17 @@ class LoginSerializer(serializers.Serializer):
         password = attrs.get('password')
 
         if email and password:
+            request = self.context.get('request')
+            # Same client identification as DRF's throttles (REMOTE_ADDR, NUM_PROXIES)
+            client_ip = BaseThrottle().get_ident(request) if request is not None else ''
+            if is_login_locked(email, client_ip):
+                raise Throttled(wait=LOGIN_FAILURE_TIMEOUT)
+
             # Since we use email as username, we need to pass it as username to authenticate
             user = authenticate(username=email, password=password)
 
             if not user:
+                record_login_failure(email, client_ip)
                 raise serializers.ValidationError(
                     'Invalid credentials. Please check your email and password.'
                 )
@@ -29,6 +45,7 @@ class LoginSerializer(serializers.Serializer):
                     'This account is disabled.'
                 )
 
+            clear_login_failures(email, client_ip)
             attrs['user'] = user
             return attrs
         else:
@@ -58,6 +75,27 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['first_name', 'last_name', 'email', 'last_access', 'is_active']
         read_only_fields = ['email', 'last_access']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load only the columns rendered here, leaving out the password hash.
+        """
+        return queryset.only('id', *cls.Meta.fields)
+
+    def to_representation(self, instance):
+        """
+        Build each row directly from the instance, skipping the per-field
+        get_attribute/to_representation dispatch for every row of the list.
+        The output matches the declared fields.
+        """
+        return {
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'email': instance.email,
+            'last_access': self.fields['last_access'].to_representation(instance.last_access),
+            'is_active': instance.is_active,
+        }
+
 
 class UserCreateSerializer(serializers.ModelSerializer):
     """
@@ -69,24 +107,24 @@ class UserCreateSerializer(serializers.ModelSerializer):
         model = User
         fields = ['email', 'password', 'first_name', 'last_name']
         extra_kwargs = {
+            # Uniqueness is enforced by the database constraint, see create()
+            'email': {'validators': []},
             'first_name': {'required': False},
             'last_name': {'required': False},
         }
 
-    def validate_email(self, value):
-        """Validate that email is unique."""
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('A user with this email already exists.')
-        return value
-
     def create(self, validated_data):
         """Create and return a new user instance with encrypted password."""
-        user = User.objects.create_user(
-            email=validated_data['email'],
-            password=validated_data['password'],
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', '')
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=validated_data['email'],
+                    password=validated_data['password'],
+                    first_name=validated_data.get('first_name', ''),
+                    last_name=validated_data.get('last_name', '')
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({'email': DUPLICATE_EMAIL_MESSAGE})
         return user
 
 
@@ -94,35 +132,43 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating user information.
     Allows modification of first_name, last_name, email and password.
+    Its representation matches UserSerializer, so the view can respond with
+    serializer.data directly.
     """
     password = serializers.CharField(write_only=True, required=False, allow_blank=True)
 
     class Meta:
         model = User
-        fields = ['first_name', 'last_name', 'email', 'password']
+        fields = ['first_name', 'last_name', 'email', 'last_access', 'is_active', 'password']
+        read_only_fields = ['last_access', 'is_active']
         extra_kwargs = {
-            'email': {'required': False},
+            # Uniqueness is enforced by the database constraint, see update()
+            'email': {'required': False, 'validators': []},
             'first_name': {'required': False},
             'last_name': {'required': False},
         }
 
-    def validate_email(self, value):
-        """Validate that email is unique if being updated."""
-        user = self.instance
-        if value and User.objects.exclude(pk=user.pk).filter(email=value).exists():
-            raise serializers.ValidationError('A user with this email already exists.')
-        return value
-
     def update(self, instance, validated_data):
-        """Update and return the user instance."""
-        instance.first_name = validated_data.get('first_name', instance.first_name)
-        instance.last_name = validated_data.get('last_name', instance.last_name)
-        instance.email = validated_data.get('email', instance.email)
+        """Update and return the user instance, writing only the columns that were sent."""
+        changed = []
+        for field in ('first_name', 'last_name', 'email'):
+            if field in validated_data:
+                setattr(instance, field, validated_data[field])
+                changed.append(field)
 
         # Update password if provided
         password = validated_data.get('password')
         if password:
             instance.set_password(password)
+            changed.append('password')
+
+        if not changed:
+            return instance
 
-        instance.save()
+        try:
+            with transaction.atomic():
+                # last_access is auto_now, which update_fields only bumps when listed
+                instance.save(update_fields=[*changed, 'last_access'])
+        except IntegrityError:
+            raise serializers.ValidationError({'email': DUPLICATE_EMAIL_MESSAGE})
         return instance
@@ -1,3 +1,183 @@
-from django.test import TestCase
+from unittest import mock, skipUnless
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from .backends import LOGIN_FIELDS
+from .cache import LOGIN_ACCOUNT_FAILURE_LIMIT, LOGIN_FAILURE_LIMIT
+from .models import User
 
-# Create your tests here.
+
+class JWTAuthenticationTests(APITestCase):
+    """A deactivated user's token stops working on the next request."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='member@example.com', password='secret-pass')
+        self.token = AccessToken.for_user(self.user)
+
+    def test_deactivated_user_is_rejected(self):
+        admin = User.objects.create_user(email='admin@example.com', password='secret-pass')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(self.client.get(reverse('user_list')).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(admin)
+        self.client.post(reverse('user_deactivate', args=[self.user.pk]))
+        self.client.force_authenticate(None)
+
+        response = self.client.get(reverse('user_list'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class EmailBackendTests(APITestCase):
+    """Users authenticate by email, loading only the login columns."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='member@example.com', password='secret-pass')
+
+    def test_authenticates_by_email(self):
+        for credentials in ({'email': self.user.email}, {'username': self.user.email}):
+            with self.subTest(**credentials):
+                self.assertEqual(authenticate(password='secret-pass', **credentials), self.user)
+
+    def test_loads_only_login_fields(self):
+        user = authenticate(email=self.user.email, password='secret-pass')
+
+        loaded = {field.attname for field in User._meta.concrete_fields} - user.get_deferred_fields()
+        self.assertEqual(loaded, set(LOGIN_FIELDS))
+
+    def test_wrong_password_or_inactive_user_is_rejected(self):
+        self.assertIsNone(authenticate(email=self.user.email, password='wrong-pass'))
+
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(authenticate(email=self.user.email, password='secret-pass'))
+
+    def test_unknown_email_still_hashes_the_password(self):
+        with mock.patch.object(User, 'set_password') as set_password:
+            self.assertIsNone(authenticate(email='nobody@example.com', password='secret-pass'))
+
+        set_password.assert_called_once_with('secret-pass')
+
+
+class LoginLockoutTests(APITestCase):
+    """Repeated failed logins lock out the failing client only."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='member@example.com', password='secret-pass')
+        self.url = reverse('login')
+
+    def login(self, password, client_ip='10.0.0.1'):
+        return self.client.post(
+            self.url, {'email': self.user.email, 'password': password},
+            format='json', REMOTE_ADDR=client_ip
+        )
+
+    def test_client_is_locked_after_repeated_failures(self):
+        for _ in range(LOGIN_FAILURE_LIMIT):
+            self.assertEqual(self.login('wrong').status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.login('secret-pass')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_other_clients_can_still_log_in(self):
+        for _ in range(LOGIN_FAILURE_LIMIT):
+            self.login('wrong')
+
+        response = self.login('secret-pass', client_ip='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.json())
+
+    def test_account_is_locked_after_failures_from_many_clients(self):
+        for attempt in range(LOGIN_ACCOUNT_FAILURE_LIMIT):
+            client_ip = f'10.0.1.{attempt % (LOGIN_FAILURE_LIMIT * 2)}'
+            self.assertEqual(self.login('wrong', client_ip).status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.login('secret-pass', client_ip='10.0.2.1')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_successful_login_resets_the_count(self):
+        for _ in range(LOGIN_FAILURE_LIMIT - 1):
+            self.login('wrong')
+        self.assertEqual(self.login('secret-pass').status_code, status.HTTP_200_OK)
+
+        self.login('wrong')
+
+        self.assertEqual(self.login('secret-pass').status_code, status.HTTP_200_OK)
+
+
+class UserEndpointTests(APITestCase):
+    """Activate/deactivate toggles and email uniqueness on writes."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(email='admin@example.com', password='secret-pass')
+        self.user = User.objects.create_user(email='member@example.com', password='secret-pass')
+        self.client.force_authenticate(self.admin)
+
+    def test_deactivate_returns_serialized_user(self):
+        response = self.client.post(reverse('user_deactivate', args=[self.user.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['user']['email'], self.user.email)
+        self.assertEqual(response.json()['user']['is_active'], False)
+
+    def test_toggle_already_in_state_returns_400(self):
+        response = self.client.post(reverse('user_activate', args=[self.user.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_toggle_missing_user_returns_404(self):
+        response = self.client.post(reverse('user_deactivate', args=[self.user.pk + 1000]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @skipUnless(connection.vendor == 'postgresql', 'UPDATE ... RETURNING path')
+    def test_toggle_is_a_single_statement_on_postgres(self):
+        last_access = User.objects.get(pk=self.user.pk).last_access
+
+        with self.assertNumQueries(1):
+            response = self.client.post(reverse('user_deactivate', args=[self.user.pk]))
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertFalse(user.is_active)
+        self.assertGreater(user.last_access, last_access)
+        self.assertEqual(parse_datetime(response.json()['user']['last_access']), user.last_access)
+
+    def test_toggle_without_returning_renders_the_same_user(self):
+        with mock.patch.object(connection, 'vendor', 'sqlite'):
+            fallback = self.client.post(reverse('user_deactivate', args=[self.user.pk])).json()
+        User.objects.filter(pk=self.user.pk).update(is_active=True)
+        returning = self.client.post(reverse('user_deactivate', args=[self.user.pk])).json()
+
+        self.assertEqual(fallback['user'].keys(), returning['user'].keys())
+        self.assertEqual(fallback['user']['is_active'], returning['user']['is_active'])
+
+    def test_update_to_taken_email_returns_400(self):
+        response = self.client.patch(
+            reverse('user_update', args=[self.user.pk]), {'email': self.admin.email}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+
+    def test_register_taken_email_returns_400(self):
+        response = self.client.post(
+            reverse('user_register'), {'email': self.user.email, 'password': 'secret-pass'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.json())
+
+    def test_list_envelope(self):
+        response = self.client.get(reverse('user_list'))
+
+        body = response.json()
+        self.assertEqual(body['count'], 2)
+        self.assertEqual([row['email'] for row in body['results']], [self.user.email, self.admin.email])
@@ -1,11 +1,14 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.generics import GenericAPIView, ListAPIView, UpdateAPIView, CreateAPIView
-from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from django.shortcuts import get_object_or_404
+from django.db import connection
+from django.http import Http404
 from .serializers import LoginSerializer, UserSerializer, UserUpdateSerializer, UserCreateSerializer
 from .models import User
+from core.mixins import EagerLoadingMixin
+from core.pagination import StandardResultsSetPagination
+from core.views import FlagToggleView, flag_changes
 
 
 class LoginView(GenericAPIView):
@@ -62,16 +65,22 @@ class UserCreateView(CreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class UserListView(ListAPIView):
+class UserListView(EagerLoadingMixin, ListAPIView):
     """
     View to list all users.
 
-    GET: Returns a list of all users with their information.
+    GET: Returns a list of all users with their information, newest first.
     Requires JWT authentication via Bearer token.
+
+    Pagination:
+    - ?limit=25&offset=50 (default limit 25, maximum 100)
+    - The response is {"count", "next", "previous", "results"}
     """
-    queryset = User.objects.all()
+    # The id tie-breaker keeps offset pages stable when users share a creation_date
+    queryset = User.objects.order_by('-creation_date', '-id')
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardResultsSetPagination
 
 
 class UserUpdateView(UpdateAPIView):
@@ -93,61 +102,69 @@ class UserUpdateView(UpdateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        # Return updated user data with UserSerializer
-        user_serializer = UserSerializer(instance)
         return Response({
             'message': 'User updated successfully',
-            'user': user_serializer.data
+            'user': serializer.data
         }, status=status.HTTP_200_OK)
 
 
-class UserActivateView(APIView):
+class UserFlagToggleView(FlagToggleView):
+    """
+    FlagToggleView for users. On PostgreSQL the flag is set and the
+    serialized columns are read back by one UPDATE ... RETURNING statement,
+    instead of an UPDATE followed by a SELECT.
+    """
+    model = User
+    field = 'is_active'
+    serializer_class = UserSerializer
+    response_key = 'user'
+
+    def toggle(self, pk):
+        if connection.vendor != 'postgresql':
+            return super().toggle(pk)
+
+        opts = User._meta
+        quote_name = connection.ops.quote_name
+        changes = flag_changes(User, self.field, self.value)
+        assignments = ', '.join(f'{quote_name(opts.get_field(name).column)} = %s' for name in changes)
+        returning = ', '.join(
+            quote_name(opts.get_field(name).column) for name in ('id', *UserSerializer.Meta.fields)
+        )
+        users = list(User.objects.raw(
+            f'UPDATE {quote_name(opts.db_table)} SET {assignments} '
+            f'WHERE {quote_name(opts.pk.column)} = %s '
+            f'AND {quote_name(opts.get_field(self.field).column)} <> %s '
+            f'RETURNING {returning}',
+            [*changes.values(), pk, self.value]
+        ))
+        if not users:
+            if not User.objects.filter(pk=pk).exists():
+                raise Http404
+            return None
+
+        self.after_update()
+        return users[0]
+
+
+class UserActivateView(UserFlagToggleView):
     """
     View to activate a user account.
 
     POST: Sets is_active=True for the specified user.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        user = get_object_or_404(User, pk=pk)
-
-        if user.is_active:
-            return Response({
-                'message': 'User is already active'
-            }, status=status.HTTP_400_BAD_REQUEST)
+    value = True
+    message = 'User activated successfully'
+    already_message = 'User is already active'
 
-        user.is_active = True
-        user.save()
 
-        return Response({
-            'message': 'User activated successfully',
-            'user': UserSerializer(user).data
-        }, status=status.HTTP_200_OK)
-
-
-class UserDeactivateView(APIView):
+class UserDeactivateView(UserFlagToggleView):
     """
     View to deactivate a user account.
 
     POST: Sets is_active=False for the specified user.
     Requires JWT authentication via Bearer token.
     """
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request, pk):
-        user = get_object_or_404(User, pk=pk)
-
-        if not user.is_active:
-            return Response({
-                'message': 'User is already inactive'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        user.is_active = False
-        user.save()
-
-        return Response({
-            'message': 'User deactivated successfully',
-            'user': UserSerializer(user).data
-        }, status=status.HTTP_200_OK)
+    value = False
+    message = 'User deactivated successfully'
+    already_message = 'User is already inactive'